@@ -361,6 +361,35 @@ def addLight(
 
 
 #####################################################################
+_text_prop_cache = {}
+
+def _cachedTextProperty():
+    # prototype text property for widget labels, built once per font file;
+    # callers ShallowCopy it and then set only color and size
+    fontfile = settings.fonts_path + settings.defaultFont + '.ttf'
+    tp = _text_prop_cache.get(fontfile)
+    if tp is None:
+        tp = vtk.vtkTextProperty()
+        tp.SetFontFamily(vtk.VTK_FONT_FILE)
+        tp.SetFontFile(fontfile)
+        tp.ShadowOff()
+        tp.ItalicOff()
+        tp.BoldOff()
+        _text_prop_cache[fontfile] = tp
+    return tp
+
+
+def _backgroundIsBright(plt):
+    # show(bg=...) can change the background, so key the cache on its value
+    bgkey = str(plt.backgrcol)
+    cached = getattr(plt, '_bgIsBright', None)
+    if cached is not None and cached[0] == bgkey:
+        return cached[1]
+    bright = np.sum(getColor(plt.backgrcol)) > 1.5
+    plt._bgIsBright = (bgkey, bright)
+    return bright
+
+
 def addScalarBar(obj,
                  pos=(0.8,0.05),
                  title="",
@@ -423,14 +452,11 @@ def addScalarBar(obj,
             for r in shapes._reps:
                 title = title.replace(r[0], r[1])
         titprop = sb.GetTitleTextProperty()
+        titprop.ShallowCopy(_cachedTextProperty())
         titprop.BoldOn()
-        titprop.ItalicOff()
-        titprop.ShadowOff()
         titprop.SetColor(c)
         titprop.SetVerticalJustificationToTop()
         titprop.SetFontSize(titleFontSize)
-        titprop.SetFontFamily(vtk.VTK_FONT_FILE)
-        titprop.SetFontFile(settings.fonts_path + settings.defaultFont +'.ttf')
         sb.SetTitle(title)
         sb.SetVerticalTitleSeparation(titleYOffset)
         sb.SetTitleTextProperty(titprop)
@@ -458,10 +484,8 @@ def addScalarBar(obj,
         sb.SetNumberOfLabels(nlabels)
 
     sctxt = sb.GetLabelTextProperty()
-    sctxt.SetFontFamily(vtk.VTK_FONT_FILE)
-    sctxt.SetFontFile(settings.fonts_path + settings.defaultFont +'.ttf')
+    sctxt.ShallowCopy(_cachedTextProperty())
     sctxt.SetColor(c)
-    sctxt.SetShadow(0)
     sctxt.SetFontSize(titleFontSize-2)
     sb.SetAnnotationTextProperty(sctxt)
     sb.PickableOff()
@@ -516,7 +540,7 @@ def addScalarBar3D(
     ncolls = len(settings.collectable_actors)
     if plt and c is None:  # automatic black or white
         c = (0.9, 0.9, 0.9)
-        if np.sum(getColor(plt.backgrcol)) > 1.5:
+        if _backgroundIsBright(plt):
             c = (0.1, 0.1, 0.1)
     if c is None: c = (0,0,0)
     c = getColor(c)
@@ -540,7 +564,8 @@ def addScalarBar3D(
         vmin, vmax = lut.GetRange()
 
     elif utils.isSequence(obj):
-        vmin, vmax = np.min(obj), np.max(obj)
+        obj = np.asarray(obj) # convert once, scan twice
+        vmin, vmax = obj.min(), obj.max()
 
     else:
         print("Error in ScalarBar3D(): input must be Mesh or list.", type(obj))
@@ -566,17 +591,18 @@ def addScalarBar3D(
     tacts = []
     ticks_pos, ticks_txt = utils.make_ticks(vmin, vmax, nlabels)
     nlabels2 = len(ticks_pos)-1
-    for i, p in enumerate(ticks_pos):
-        tx = ticks_txt[i]
+    ys = np.linspace(-sy/2, sy/2, nlabels2+1) # all label heights at once
+    lbx = sx * labelOffset
+    lbs = sy / 60
+    ticx = xbns[1] + lbx/4
+    for i, tx in enumerate(ticks_txt):
         if i and tx:
             # build numeric text
-            y = -sy /2 + sy * i / nlabels2
-            a = shapes.Text(tx, pos=[sx*labelOffset, y, 0], s=sy/60,
+            a = shapes.Text(tx, pos=[lbx, ys[i], 0], s=lbs,
                             justify='center-left', c=c, italic=italic, font=labelFont)
             tacts.append(a)
             # build ticks
-            tic = shapes.Line([xbns[1], y, 0],
-                              [xbns[1]+sx*labelOffset/4, y, 0], lw=0.1, c=c)
+            tic = shapes.Line([xbns[1], ys[i], 0], [ticx, ys[i], 0], lw=0.1, c=c)
             tacts.append(tic)
 
     # build title
@@ -592,11 +618,14 @@ def addScalarBar3D(
 
     for a in tacts: a.PickableOff()
 
-    mtacts = merge(tacts).lighting('off')
-    mtacts.PickableOff()
     scale.PickableOff()
 
-    sact = Assembly(scale, tacts)
+    mtacts = merge(tacts) # can be None, e.g. for constant scalars
+    if mtacts is not None:
+        mtacts.lighting('off').PickableOff()
+        sact = Assembly(scale, mtacts)
+    else:
+        sact = Assembly(scale)
     sact.SetPosition(pos)
     sact.PickableOff()
     sact.UseBoundsOff()
@@ -606,6 +635,21 @@ def addScalarBar3D(
 
 
 #####################################################################
+# endpoints of the 2D slider for each corner position number,
+# horizontal [1-5] or vertical [11-15]
+_slider2d_positions = {
+     1: ((0.04, 0.96 ), (0.45, 0.96 )), # top-left horizontal
+     2: ((0.55, 0.96 ), (0.96, 0.96 )),
+     3: ((0.04, 0.045), (0.45, 0.045)),
+     4: ((0.55, 0.045), (0.96, 0.045)), # bottom-right
+     5: ((0.04, 0.045), (0.96, 0.045)), # bottom margin horizontal
+    11: ((0.04, 0.54 ), (0.04, 0.9  )), # top-left vertical
+    12: ((0.96, 0.54 ), (0.96, 0.9  )),
+    13: ((0.04, 0.1  ), (0.04, 0.54 )),
+    14: ((0.96, 0.1  ), (0.96, 0.54 )), # bottom-right vertical
+    15: ((0.96, 0.1  ), (0.96, 0.9  )), # right margin vertical
+}
+
 def addSlider2D(sliderfunc, xmin, xmax, value=None, pos=4,
                 title='', font='', titleSize=1, c=None, showValue=True):
     """Add a slider widget which can call an external custom function.
@@ -626,7 +670,7 @@ def addSlider2D(sliderfunc, xmin, xmax, value=None, pos=4,
     plt = settings.plotter_instance
     if c is None:  # automatic black or white
         c = (0.8, 0.8, 0.8)
-        if np.sum(getColor(plt.backgrcol)) > 1.5:
+        if _backgroundIsBright(plt):
             c = (0.2, 0.2, 0.2)
     c = getColor(c)
 
@@ -647,36 +691,10 @@ def addSlider2D(sliderfunc, xmin, xmax, value=None, pos=4,
     if utils.isSequence(pos):
         sliderRep.GetPoint1Coordinate().SetValue(pos[0][0], pos[0][1])
         sliderRep.GetPoint2Coordinate().SetValue(pos[1][0], pos[1][1])
-    elif pos == 1:  # top-left horizontal
-        sliderRep.GetPoint1Coordinate().SetValue(0.04, 0.96)
-        sliderRep.GetPoint2Coordinate().SetValue(0.45, 0.96)
-    elif pos == 2:
-        sliderRep.GetPoint1Coordinate().SetValue(0.55, 0.96)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.96)
-    elif pos == 3:
-        sliderRep.GetPoint1Coordinate().SetValue(0.04, 0.045)
-        sliderRep.GetPoint2Coordinate().SetValue(0.45, 0.045)
-    elif pos == 4:  # bottom-right
-        sliderRep.GetPoint1Coordinate().SetValue(0.55, 0.045)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.045)
-    elif pos == 5:  # bottom margin horizontal
-        sliderRep.GetPoint1Coordinate().SetValue(0.04, 0.045)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.045)
-    elif pos == 11:  # top-left vertical
-        sliderRep.GetPoint1Coordinate().SetValue(0.04, 0.54)
-        sliderRep.GetPoint2Coordinate().SetValue(0.04, 0.9)
-    elif pos == 12:
-        sliderRep.GetPoint1Coordinate().SetValue(0.96, 0.54)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.9)
-    elif pos == 13:
-        sliderRep.GetPoint1Coordinate().SetValue(0.04, 0.1)
-        sliderRep.GetPoint2Coordinate().SetValue(0.04, 0.54)
-    elif pos == 14:  # bottom-right vertical
-        sliderRep.GetPoint1Coordinate().SetValue(0.96, 0.1)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.54)
-    elif pos == 15:  # right margin vertical
-        sliderRep.GetPoint1Coordinate().SetValue(0.96, 0.1)
-        sliderRep.GetPoint2Coordinate().SetValue(0.96, 0.9)
+    elif pos in _slider2d_positions:
+        p1, p2 = _slider2d_positions[pos]
+        sliderRep.GetPoint1Coordinate().SetValue(p1[0], p1[1])
+        sliderRep.GetPoint2Coordinate().SetValue(p2[0], p2[1])
 
     if showValue:
         if isinstance(xmin, int) and isinstance(xmax, int):
@@ -771,7 +789,7 @@ def addSlider3D(
     plt = settings.plotter_instance
     if c is None:  # automatic black or white
         c = (0.8, 0.8, 0.8)
-        if np.sum(getColor(plt.backgrcol)) > 1.5:
+        if _backgroundIsBright(plt):
             c = (0.2, 0.2, 0.2)
     else:
         c = getColor(c)
@@ -898,7 +916,7 @@ def addCutterTool(mesh):
     act1.mapper().SetInputConnection(clipper.GetClippedOutputPort()) # needs OutputPort
     act1.alpha(0.04).color((0.5,0.5,0.5)).wireframe()
 
-    plt.remove(mesh)
+    plt.remove(mesh, render=False) # a single render when the parts are added
     plt.add([act0, act1])
 
     def selectPolygons(vobj, event):
@@ -1010,19 +1028,26 @@ def addIcon(mesh, pos=3, size=0.08):
 
 #####################################################################
 def computeVisibleBounds():
-    """Calculate max meshes bounds and sizes."""
-    bns = []
-    for a in settings.plotter_instance.actors:
-        if a and a.GetUseBounds():
+    """Calculate max meshes bounds and sizes.
+
+    Actors that are hidden or have ``UseBoundsOff()`` set do not contribute.
+    """
+    plt = settings.plotter_instance
+    bns = np.empty((len(plt.actors), 6)) # fill in place, no list round-trip
+    n = 0
+    for a in plt.actors:
+        if a and a.GetVisibility() and a.GetUseBounds():
             b = a.GetBounds()
             if b:
-                bns.append(b)
-    if len(bns):
-        max_bns = np.max(bns, axis=0)
-        min_bns = np.min(bns, axis=0)
+                bns[n] = b
+                n += 1
+    if n:
+        bns = bns[:n]
+        max_bns = bns.max(axis=0)
+        min_bns = bns.min(axis=0)
         vbb = (min_bns[0], max_bns[1], min_bns[2], max_bns[3], min_bns[4], max_bns[5])
     else:
-        vbb = settings.plotter_instance.renderer.ComputeVisiblePropBounds()
+        vbb = plt.renderer.ComputeVisiblePropBounds()
         max_bns = vbb
         min_bns = vbb
     sizes = np.array([max_bns[1]-min_bns[0], max_bns[3]-min_bns[2], max_bns[5]-min_bns[4]])
@@ -1290,13 +1315,14 @@ def buildAxes(obj=None,
     if not ssmax:
         return
 
-    if ss[0]/ssmax < limitRatio:
+    sslim = limitRatio * ssmax # one multiplication instead of three divisions
+    if ss[0] < sslim:
         ss[0] = 0
         xtitle = ''
-    if ss[1]/ssmax < limitRatio:
+    if ss[1] < sslim:
         ss[1] = 0
         ytitle = ''
-    if ss[2]/ssmax < limitRatio:
+    if ss[2] < sslim:
         ss[2] = 0
         ztitle = ''
 
@@ -1426,20 +1452,30 @@ def buildAxes(obj=None,
         grids.append(gzx)
 
     grids2 = []
+    # the far wall of each pair has the same geometry of the near one: clone it when available
     if xyGrid2 and xtitle and ytitle:
-        gxy2 = shapes.Grid(sx=xticks_float, sy=yticks_float).z(1)
+        gxy2 = gxy.clone() if xyGrid else shapes.Grid(sx=xticks_float, sy=yticks_float)
+        gxy2.z(1)
         gxy2.alpha(xyAlpha).wireframe(xyGrid2Transparent).c(xyPlaneColor).lw(gridLineWidth).lc(xyGridColor)
         gxy2.name = "xyGrid2"
         grids2.append(gxy2)
     if yzGrid2 and ytitle and ztitle:
-        gyz2 = shapes.Grid(sx=zticks_float, sy=yticks_float).x(1)
-        gyz2.RotateY(-90)
+        if yzGrid:
+            gyz2 = gyz.clone() # orientation is copied over too
+        else:
+            gyz2 = shapes.Grid(sx=zticks_float, sy=yticks_float)
+            gyz2.RotateY(-90)
+        gyz2.x(1)
         gyz2.alpha(yzAlpha).wireframe(yzGrid2Transparent).c(yzPlaneColor).lw(gridLineWidth).lc(yzGridColor)
         gyz2.name = "yzGrid2"
         grids2.append(gyz2)
     if zxGrid2 and ztitle and xtitle:
-        gzx2 = shapes.Grid(sx=xticks_float, sy=zticks_float).y(1)
-        gzx2.RotateX(90)
+        if zxGrid:
+            gzx2 = gzx.clone()
+        else:
+            gzx2 = shapes.Grid(sx=xticks_float, sy=zticks_float)
+            gzx2.RotateX(90)
+        gzx2.y(1)
         gzx2.alpha(zxAlpha).wireframe(zxGrid2Transparent).c(zxPlaneColor).lw(gridLineWidth).lc(zxGridColor)
         gzx2.name = "zxGrid2"
         grids2.append(gzx2)
@@ -1873,7 +1909,7 @@ def addGlobalAxes(axtype=None, c=None):
 
     if c is None:  # automatic black or white
         c = (0.9, 0.9, 0.9)
-        if np.sum(plt.renderer.GetBackground()) > 1.5:
+        if sum(plt.renderer.GetBackground()) > 1.5: # plain sum, no ndarray
             c = (0.1, 0.1, 0.1)
     else:
         c = getColor(c) # for speed
@@ -1888,11 +1924,20 @@ def addGlobalAxes(axtype=None, c=None):
     # custom grid walls
     if plt.axes == 1 or plt.axes is True or isinstance(plt.axes, dict):
 
-        if isinstance(plt.axes, dict):
-            plt.axes.update({'useGlobal':True})
-            asse = buildAxes(None, **plt.axes)
+        # reuse the assembly if the scene bounds and titles are unchanged,
+        # e.g. when toggling axes on and off with the keyboard
+        sig = tuple(computeVisibleBounds()[0])
+        sig += (str(plt.axes), plt.xtitle, plt.ytitle, plt.ztitle, c)
+        cached = plt._axes_cache.get((r, 1))
+        if cached is not None and cached[0] == sig:
+            asse = cached[1]
         else:
-            asse = buildAxes(None, useGlobal=True)
+            if isinstance(plt.axes, dict):
+                plt.axes.update({'useGlobal':True})
+                asse = buildAxes(None, **plt.axes)
+            else:
+                asse = buildAxes(None, useGlobal=True)
+            plt._axes_cache[(r, 1)] = (sig, asse)
 
         plt.renderer.AddActor(asse)
         plt.axes_instances[r] = asse
@@ -1919,43 +1964,46 @@ def addGlobalAxes(axtype=None, c=None):
                 z0 = 0
 
         dx, dy, dz = x1 - x0, y1 - y0, z1 - z0
+        lx, ly, lz = len(plt.xtitle), len(plt.ytitle), len(plt.ztitle)
+        aves40 = aves / 40 * s # text size, computed once for the three titles
+        aves100 = aves / 100   # minimum axis extent
+        r_shaft = aves / 250 * s
+        r_tip, h_tip = aves / 100 * s, aves / 25 * s
+
+        def makeArrow(p0, p1, axis, col): # shaft and tip fused into one actor
+            shaft = shapes.Cylinder([p0, p1], r=r_shaft, c=col, alpha=alpha)
+            tip = shapes.Cone(pos=p1, c=col, alpha=alpha,
+                              r=r_tip, height=h_tip, axis=axis, res=10)
+            return merge(shaft, tip)
+
         acts = []
         if x0 * x1 <= 0 or y0 * z1 <= 0 or z0 * z1 <= 0:  # some ranges contain origin
             zero = shapes.Sphere(r=aves / 120 * s, c="k", alpha=alpha, res=10)
             acts += [zero]
 
-        if len(plt.xtitle) and dx > aves/100:
-            xl = shapes.Cylinder([[x0, 0, 0], [x1, 0, 0]], r=aves/250*s, c=xcol, alpha=alpha)
-            xc = shapes.Cone(pos=[x1, 0, 0], c=xcol, alpha=alpha,
-                             r=aves/100*s, height=aves/25*s, axis=[1, 0, 0], res=10)
-            wpos = [x1-(len(plt.xtitle)+1)*aves/40*s, -aves/25*s, 0]  # aligned to arrow tip
+        if lx and dx > aves100:
+            wpos = [x1-(lx+1)*aves40, -h_tip, 0]  # aligned to arrow tip
             if centered:
-                wpos = [(x0 + x1) / 2 - len(plt.xtitle) / 2 * aves / 40 * s, -aves / 25 * s, 0]
-            xt = shapes.Text(plt.xtitle, pos=wpos, s=aves / 40 * s, c=xcol)
-            acts += [xl, xc, xt]
-
-        if len(plt.ytitle) and dy > aves/100:
-            yl = shapes.Cylinder([[0, y0, 0], [0, y1, 0]], r=aves/250*s, c=ycol, alpha=alpha)
-            yc = shapes.Cone(pos=[0, y1, 0], c=ycol, alpha=alpha,
-                             r=aves/100*s, height=aves/25*s, axis=[0, 1, 0], res=10)
-            wpos = [-aves/40*s, y1-(len(plt.ytitle)+1)*aves/40*s, 0]
+                wpos = [(x0 + x1) / 2 - lx / 2 * aves40, -h_tip, 0]
+            xt = shapes.Text(plt.xtitle, pos=wpos, s=aves40, c=xcol)
+            acts += [makeArrow([x0, 0, 0], [x1, 0, 0], [1, 0, 0], xcol), xt]
+
+        if ly and dy > aves100:
+            wpos = [-aves/40*s, y1-(ly+1)*aves40, 0]
             if centered:
-                wpos = [-aves / 40 * s, (y0 + y1) / 2 - len(plt.ytitle) / 2 * aves / 40 * s, 0]
-            yt = shapes.Text(plt.ytitle, pos=(0, 0, 0), s=aves / 40 * s, c=ycol)
+                wpos = [-aves / 40 * s, (y0 + y1) / 2 - ly / 2 * aves40, 0]
+            yt = shapes.Text(plt.ytitle, pos=(0, 0, 0), s=aves40, c=ycol)
             yt.pos(wpos).RotateZ(90)
-            acts += [yl, yc, yt]
+            acts += [makeArrow([0, y0, 0], [0, y1, 0], [0, 1, 0], ycol), yt]
 
-        if len(plt.ztitle) and dz > aves/100:
-            zl = shapes.Cylinder([[0, 0, z0], [0, 0, z1]], r=aves/250*s, c=zcol, alpha=alpha)
-            zc = shapes.Cone(pos=[0, 0, z1], c=zcol, alpha=alpha,
-                             r=aves/100*s, height=aves/25*s, axis=[0, 0, 1], res=10)
-            wpos = [-aves/50*s, -aves/50*s, z1 - (len(plt.ztitle)+1)*aves/40*s]
+        if lz and dz > aves100:
+            wpos = [-aves/50*s, -aves/50*s, z1 - (lz+1)*aves40]
             if centered:
-                wpos = [-aves/50*s, -aves/50*s, (z0+z1)/2-len(plt.ztitle)/2*aves/40*s]
-            zt = shapes.Text(plt.ztitle, pos=(0,0,0), s=aves/40*s, c=zcol)
+                wpos = [-aves/50*s, -aves/50*s, (z0+z1)/2 - lz/2*aves40]
+            zt = shapes.Text(plt.ztitle, pos=(0,0,0), s=aves40, c=zcol)
             zt.pos(wpos).RotateZ(45)
             zt.RotateX(90)
-            acts += [zl, zc, zt]
+            acts += [makeArrow([0, 0, z0], [0, 0, z1], [0, 0, 1], zcol), zt]
         for a in acts:
             a.PickableOff()
         ass = Assembly(acts)
@@ -1964,70 +2012,84 @@ def addGlobalAxes(axtype=None, c=None):
         plt.axes_instances[r] = ass
 
     elif plt.axes == 4:
-        axact = vtk.vtkAxesActor()
-        axact.SetShaftTypeToCylinder()
-        axact.SetCylinderRadius(0.03)
-        axact.SetXAxisLabelText(plt.xtitle)
-        axact.SetYAxisLabelText(plt.ytitle)
-        axact.SetZAxisLabelText(plt.ztitle)
-        axact.GetXAxisShaftProperty().SetColor(1, 0, 0)
-        axact.GetYAxisShaftProperty().SetColor(0, 1, 0)
-        axact.GetZAxisShaftProperty().SetColor(0, 0, 1)
-        axact.GetXAxisTipProperty().SetColor(1, 0, 0)
-        axact.GetYAxisTipProperty().SetColor(0, 1, 0)
-        axact.GetZAxisTipProperty().SetColor(0, 0, 1)
-        bc = np.array(plt.renderer.GetBackground())
-        if np.sum(bc) < 1.5:
+        if sum(plt.renderer.GetBackground()) < 1.5:
             lc = (1, 1, 1)
         else:
             lc = (0, 0, 0)
-        axact.GetXAxisCaptionActor2D().GetCaptionTextProperty().BoldOff()
-        axact.GetYAxisCaptionActor2D().GetCaptionTextProperty().BoldOff()
-        axact.GetZAxisCaptionActor2D().GetCaptionTextProperty().BoldOff()
-        axact.GetXAxisCaptionActor2D().GetCaptionTextProperty().ItalicOff()
-        axact.GetYAxisCaptionActor2D().GetCaptionTextProperty().ItalicOff()
-        axact.GetZAxisCaptionActor2D().GetCaptionTextProperty().ItalicOff()
-        axact.GetXAxisCaptionActor2D().GetCaptionTextProperty().ShadowOff()
-        axact.GetYAxisCaptionActor2D().GetCaptionTextProperty().ShadowOff()
-        axact.GetZAxisCaptionActor2D().GetCaptionTextProperty().ShadowOff()
-        axact.GetXAxisCaptionActor2D().GetCaptionTextProperty().SetColor(lc)
-        axact.GetYAxisCaptionActor2D().GetCaptionTextProperty().SetColor(lc)
-        axact.GetZAxisCaptionActor2D().GetCaptionTextProperty().SetColor(lc)
-        axact.PickableOff()
-        icn = addIcon(axact, size=0.1)
+        sig = (plt.xtitle, plt.ytitle, plt.ztitle, lc)
+        cached = plt._axes_cache.get((r, 4))
+        if cached is not None and cached[0] == sig:
+            icn = cached[1] # reuse the widget, text atlases are expensive
+            icn.EnabledOn()
+        else:
+            axact = vtk.vtkAxesActor()
+            axact.SetShaftTypeToCylinder()
+            axact.SetCylinderRadius(0.03)
+            axact.SetXAxisLabelText(plt.xtitle)
+            axact.SetYAxisLabelText(plt.ytitle)
+            axact.SetZAxisLabelText(plt.ztitle)
+            axact.GetXAxisShaftProperty().SetColor(1, 0, 0)
+            axact.GetYAxisShaftProperty().SetColor(0, 1, 0)
+            axact.GetZAxisShaftProperty().SetColor(0, 0, 1)
+            axact.GetXAxisTipProperty().SetColor(1, 0, 0)
+            axact.GetYAxisTipProperty().SetColor(0, 1, 0)
+            axact.GetZAxisTipProperty().SetColor(0, 0, 1)
+            for capt in (axact.GetXAxisCaptionActor2D(),
+                         axact.GetYAxisCaptionActor2D(),
+                         axact.GetZAxisCaptionActor2D()):
+                tprop = capt.GetCaptionTextProperty() # fetch once per axis
+                tprop.BoldOff()
+                tprop.ItalicOff()
+                tprop.ShadowOff()
+                tprop.SetColor(lc)
+            axact.PickableOff()
+            icn = addIcon(axact, size=0.1)
+            plt._axes_cache[(r, 4)] = (sig, icn)
         plt.axes_instances[r] = icn
 
     elif plt.axes == 5:
-        axact = vtk.vtkAnnotatedCubeActor()
-        axact.GetCubeProperty().SetColor(getColor(settings.annotatedCubeColor))
-        axact.SetTextEdgesVisibility(0)
-        axact.SetFaceTextScale(settings.annotatedCubeTextScale)
-        axact.SetXPlusFaceText (settings.annotatedCubeXPlusText)
-        axact.SetXMinusFaceText(settings.annotatedCubeXMinusText)
-        axact.SetYPlusFaceText (settings.annotatedCubeYPlusText)
-        axact.SetYMinusFaceText(settings.annotatedCubeYMinusText)
-        axact.SetZPlusFaceText (settings.annotatedCubeZPlusText)
-        axact.SetZMinusFaceText(settings.annotatedCubeZMinusText)
-        axact.SetZFaceTextRotation(90)
-
-        if settings.annotatedCubeTextColor is None: # use default
-            axact.GetXPlusFaceProperty().SetColor( getColor("r"))
-            axact.GetXMinusFaceProperty().SetColor(getColor("dr"))
-            axact.GetYPlusFaceProperty().SetColor( getColor("g"))
-            axact.GetYMinusFaceProperty().SetColor(getColor("dg"))
-            axact.GetZPlusFaceProperty().SetColor( getColor("b"))
-            axact.GetZMinusFaceProperty().SetColor(getColor("db"))
-        else: # use single user color
-            ac = getColor(getColor(settings.annotatedCubeTextColor))
-            axact.GetXPlusFaceProperty().SetColor(ac)
-            axact.GetXMinusFaceProperty().SetColor(ac)
-            axact.GetYPlusFaceProperty().SetColor(ac)
-            axact.GetYMinusFaceProperty().SetColor(ac)
-            axact.GetZPlusFaceProperty().SetColor(ac)
-            axact.GetZMinusFaceProperty().SetColor(ac)
-
-        axact.PickableOff()
-        icn = addIcon(axact, size=0.06)
+        sig = (settings.annotatedCubeColor,
+               settings.annotatedCubeTextColor,
+               settings.annotatedCubeTextScale,
+               settings.annotatedCubeXPlusText, settings.annotatedCubeXMinusText,
+               settings.annotatedCubeYPlusText, settings.annotatedCubeYMinusText,
+               settings.annotatedCubeZPlusText, settings.annotatedCubeZMinusText)
+        cached = plt._axes_cache.get((r, 5))
+        if cached is not None and cached[0] == sig:
+            icn = cached[1]
+            icn.EnabledOn()
+        else:
+            axact = vtk.vtkAnnotatedCubeActor()
+            axact.GetCubeProperty().SetColor(getColor(settings.annotatedCubeColor))
+            axact.SetTextEdgesVisibility(0)
+            axact.SetFaceTextScale(settings.annotatedCubeTextScale)
+            axact.SetXPlusFaceText (settings.annotatedCubeXPlusText)
+            axact.SetXMinusFaceText(settings.annotatedCubeXMinusText)
+            axact.SetYPlusFaceText (settings.annotatedCubeYPlusText)
+            axact.SetYMinusFaceText(settings.annotatedCubeYMinusText)
+            axact.SetZPlusFaceText (settings.annotatedCubeZPlusText)
+            axact.SetZMinusFaceText(settings.annotatedCubeZMinusText)
+            axact.SetZFaceTextRotation(90)
+
+            if settings.annotatedCubeTextColor is None: # use default
+                axact.GetXPlusFaceProperty().SetColor( getColor("r"))
+                axact.GetXMinusFaceProperty().SetColor(getColor("dr"))
+                axact.GetYPlusFaceProperty().SetColor( getColor("g"))
+                axact.GetYMinusFaceProperty().SetColor(getColor("dg"))
+                axact.GetZPlusFaceProperty().SetColor( getColor("b"))
+                axact.GetZMinusFaceProperty().SetColor(getColor("db"))
+            else: # use single user color
+                ac = getColor(getColor(settings.annotatedCubeTextColor))
+                axact.GetXPlusFaceProperty().SetColor(ac)
+                axact.GetXMinusFaceProperty().SetColor(ac)
+                axact.GetYPlusFaceProperty().SetColor(ac)
+                axact.GetYMinusFaceProperty().SetColor(ac)
+                axact.GetZPlusFaceProperty().SetColor(ac)
+                axact.GetZMinusFaceProperty().SetColor(ac)
+
+            axact.PickableOff()
+            icn = addIcon(axact, size=0.06)
+            plt._axes_cache[(r, 5)] = (sig, icn)
         plt.axes_instances[r] = icn
 
     elif plt.axes == 6:
@@ -2052,8 +2114,7 @@ def addGlobalAxes(axtype=None, c=None):
         ocMapper.SetInputConnection(0, ocf.GetOutputPort(0))
         ocActor = vtk.vtkActor()
         ocActor.SetMapper(ocMapper)
-        bc = np.array(plt.renderer.GetBackground())
-        if np.sum(bc) < 1.5:
+        if sum(plt.renderer.GetBackground()) < 1.5:
             lc = (1, 1, 1)
         else:
             lc = (0, 0, 0)
@@ -2065,51 +2126,64 @@ def addGlobalAxes(axtype=None, c=None):
 
     elif plt.axes == 7:
         vbb = computeVisibleBounds()[0]
-        rulax = buildRulerAxes(vbb, c=c,
-                               xtitle=plt.xtitle+' - ',
-                               ytitle=plt.ytitle+' - ',
-                               ztitle=plt.ztitle+' - ')
-        rulax.UseBoundsOff()
-        rulax.PickableOff()
+        sig = tuple(vbb) + (plt.xtitle, plt.ytitle, plt.ztitle, c)
+        cached = plt._axes_cache.get((r, 7))
+        if cached is not None and cached[0] == sig:
+            rulax = cached[1]
+        else:
+            rulax = buildRulerAxes(vbb, c=c,
+                                   xtitle=plt.xtitle+' - ',
+                                   ytitle=plt.ytitle+' - ',
+                                   ztitle=plt.ztitle+' - ')
+            rulax.UseBoundsOff()
+            rulax.PickableOff()
+            plt._axes_cache[(r, 7)] = (sig, rulax)
         plt.renderer.AddActor(rulax)
         plt.axes_instances[r] = rulax
 
     elif plt.axes == 8:
         vbb = computeVisibleBounds()[0]
-        ca = vtk.vtkCubeAxesActor()
-        ca.SetBounds(vbb)
-        ca.SetCamera(plt.renderer.GetActiveCamera())
-        ca.GetXAxesLinesProperty().SetColor(c)
-        ca.GetYAxesLinesProperty().SetColor(c)
-        ca.GetZAxesLinesProperty().SetColor(c)
-        for i in range(3):
-            ca.GetLabelTextProperty(i).SetColor(c)
-            ca.GetTitleTextProperty(i).SetColor(c)
-        ca.SetTitleOffset(5)
-        ca.SetFlyMode(3)
-        ca.SetXTitle(plt.xtitle)
-        ca.SetYTitle(plt.ytitle)
-        ca.SetZTitle(plt.ztitle)
-        if plt.xtitle == "":
-            ca.SetXAxisVisibility(0)
-            ca.XAxisLabelVisibilityOff()
-        if plt.ytitle == "":
-            ca.SetYAxisVisibility(0)
-            ca.YAxisLabelVisibilityOff()
-        if plt.ztitle == "":
-            ca.SetZAxisVisibility(0)
-            ca.ZAxisLabelVisibilityOff()
-        ca.PickableOff()
-        ca.UseBoundsOff()
+        sig = tuple(vbb) + (plt.xtitle, plt.ytitle, plt.ztitle, c)
+        cached = plt._axes_cache.get((r, 8))
+        if cached is not None and cached[0] == sig:
+            ca = cached[1]
+            ca.SetCamera(plt.renderer.GetActiveCamera())
+        else:
+            ca = vtk.vtkCubeAxesActor()
+            ca.SetBounds(vbb)
+            ca.SetCamera(plt.renderer.GetActiveCamera())
+            ca.GetXAxesLinesProperty().SetColor(c)
+            ca.GetYAxesLinesProperty().SetColor(c)
+            ca.GetZAxesLinesProperty().SetColor(c)
+            for i in range(3):
+                ca.GetLabelTextProperty(i).SetColor(c)
+                ca.GetTitleTextProperty(i).SetColor(c)
+            ca.SetTitleOffset(5)
+            ca.SetFlyMode(3)
+            ca.SetXTitle(plt.xtitle)
+            ca.SetYTitle(plt.ytitle)
+            ca.SetZTitle(plt.ztitle)
+            if plt.xtitle == "":
+                ca.SetXAxisVisibility(0)
+                ca.XAxisLabelVisibilityOff()
+            if plt.ytitle == "":
+                ca.SetYAxisVisibility(0)
+                ca.YAxisLabelVisibilityOff()
+            if plt.ztitle == "":
+                ca.SetZAxisVisibility(0)
+                ca.ZAxisLabelVisibilityOff()
+            ca.PickableOff()
+            ca.UseBoundsOff()
+            plt._axes_cache[(r, 8)] = (sig, ca)
         plt.renderer.AddActor(ca)
         plt.axes_instances[r] = ca
 
     elif plt.axes == 9:
-        vbb = computeVisibleBounds()[0]
+        vbb, ss = computeVisibleBounds()[0:2] # sizes come for free
         src = vtk.vtkCubeSource()
-        src.SetXLength(vbb[1] - vbb[0])
-        src.SetYLength(vbb[3] - vbb[2])
-        src.SetZLength(vbb[5] - vbb[4])
+        src.SetXLength(ss[0])
+        src.SetYLength(ss[1])
+        src.SetZLength(ss[2])
         src.Update()
         ca = Mesh(src.GetOutput(), c, 0.5).wireframe(True)
         ca.pos((vbb[0] + vbb[1]) / 2, (vbb[3] + vbb[2]) / 2, (vbb[5] + vbb[4]) / 2)
@@ -2232,7 +2306,7 @@ def addRendererFrame(c=None, alpha=None, lw=None):
 
     if c is None:  # automatic black or white
         c = (0.9, 0.9, 0.9)
-        if np.sum(settings.plotter_instance.renderer.GetBackground())>1.5:
+        if sum(settings.plotter_instance.renderer.GetBackground())>1.5:
             c = (0.1, 0.1, 0.1)
     c = getColor(c)
 
@@ -2277,14 +2351,6 @@ def addLegend():
     if not utils.isSequence(plt._legend):
         return
 
-    # remove old legend if present on current renderer:
-    acs = plt.renderer.GetActors2D()
-    acs.InitTraversal()
-    for i in range(acs.GetNumberOfItems()):
-        a = acs.GetNextItem()
-        if isinstance(a, vtk.vtkLegendBoxActor):
-            plt.renderer.RemoveActor(a)
-
     meshs = plt.getMeshes()
     acts, texts = [], []
     for i, a in enumerate(meshs):
@@ -2297,7 +2363,26 @@ def addLegend():
                 texts.append(a._legend)
                 acts.append(a)
 
+    r = plt.renderers.index(plt.renderer)
+    sig = (tuple(texts),
+           tuple(map(id, acts)),
+           tuple(a.GetProperty().GetColor() for a in acts),
+           settings.legendPos, settings.legendSize, settings.legendFont)
+    if plt._legend_cache.get(r) == sig:
+        return # unchanged, keep the legend already on the renderer
+
+    # remove old legend if present on current renderer:
+    acs = plt.renderer.GetActors2D()
+    acs.InitTraversal()
+    for i in range(acs.GetNumberOfItems()):
+        a = acs.GetNextItem()
+        if isinstance(a, vtk.vtkLegendBoxActor):
+            plt.renderer.RemoveActor(a)
+
     NT = len(texts)
+    if not NT:
+        plt._legend_cache.pop(r, None)
+        return # nothing to show, avoid building an empty legend box
     if NT > 20:
         NT = 20
     vtklegend = vtk.vtkLegendBoxActor()
@@ -2316,11 +2401,9 @@ def addLegend():
     pr.ShadowOff()
     pr.BoldOff()
 
-    for i in range(NT):
-        ti = texts[i]
+    for i, (ti, a) in enumerate(zip(texts[:NT], acts)):
         if not ti:
             continue
-        a = acts[i]
         c = a.GetProperty().GetColor()
         if c == (1, 1, 1):
             c = (0.2, 0.2, 0.2)
@@ -2343,5 +2426,6 @@ def addLegend():
     vtklegend.SetBackgroundOpacity(0.6)
     vtklegend.LockBorderOn()
     plt.renderer.AddActor(vtklegend)
+    plt._legend_cache[r] = sig
 
 
@@ -1692,9 +1692,7 @@ def probePoints(dataset, pts):
     def readPoints():
         output = src.GetPolyDataOutput()
         points = vtk.vtkPoints()
-        for p in pts:
-            x, y, z = p
-            points.InsertNextPoint(x, y, z)
+        points.SetData(numpy_to_vtk(np.ascontiguousarray(pts, dtype=float), deep=True))
         output.SetPoints(points)
 
         cells = vtk.vtkCellArray()
@@ -1751,9 +1749,16 @@ def probePlane(dataset, origin=(0, 0, 0), normal=(1, 0, 0)):
     plane = vtk.vtkPlane()
     plane.SetOrigin(origin)
     plane.SetNormal(normal)
-    planeCut = vtk.vtkCutter()
+    if isinstance(img, vtk.vtkImageData):
+        # the flying edges implementation is multithreaded
+        planeCut = vtk.vtkFlyingEdgesPlaneCutter()
+        planeCut.SetPlane(plane)
+        planeCut.InterpolateAttributesOn()
+        planeCut.ComputeNormalsOff()
+    else:
+        planeCut = vtk.vtkCutter()
+        planeCut.SetCutFunction(plane)
     planeCut.SetInputData(img)
-    planeCut.SetCutFunction(plane)
     planeCut.Update()
     poly = planeCut.GetOutput()
     cutmesh = vedo.mesh.Mesh(poly)
@@ -1809,7 +1814,7 @@ def interpolateToStructuredGrid(mesh, kernel=None, radius=None,
     if radius is None:
         radius = min(bounds[1]-bounds[0], bounds[3]-bounds[2], bounds[5]-bounds[4])/3
 
-    locator = vtk.vtkPointLocator()
+    locator = vtk.vtkStaticPointLocator() # threaded build
     locator.SetDataSet(output)
     locator.BuildLocator()
 
@@ -1934,8 +1939,7 @@ def streamLines(domain, probe,
     def readPoints():
         output = src.GetPolyDataOutput()
         points = vtk.vtkPoints()
-        for x, y, z in pts:
-            points.InsertNextPoint(x, y, z)
+        points.SetData(numpy_to_vtk(np.ascontiguousarray(pts, dtype=float), deep=True))
         output.SetPoints(points)
     src.SetExecuteMethod(readPoints)
     src.Update()
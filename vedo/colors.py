@@ -274,6 +274,8 @@ def _isSequence(arg):
     return False
 
 
+_colorCache = {}  # memoized name -> rgb lookups
+
 def getColor(rgb=None, hsv=None):
     """
     Convert a color or list of colors to (r,g,b) format from many different input formats.
@@ -292,6 +294,18 @@ def getColor(rgb=None, hsv=None):
 
     |colorcubes| |colorcubes.py|_
     """
+    # the same few color names get resolved over and over when building
+    # a scene, so string inputs are memoized
+    if hsv is None and isinstance(rgb, str):
+        c = _colorCache.get(rgb)
+        if c is None:
+            c = tuple(_getColor(rgb))
+            _colorCache[rgb] = c
+        return c
+    return _getColor(rgb, hsv)
+
+
+def _getColor(rgb=None, hsv=None):
     # recursion, return a list if input is list of colors:
     if _isSequence(rgb) and (len(rgb) > 3 or _isSequence(rgb[0])):
         seqcol = []
@@ -33,42 +33,46 @@ __all__ = []
 
 
 ####################################################################################
+# assembled once at import time, tips() only needs to print it
+_tips_msg = (
+    " ==========================================================\n"
+    "| Press: i     print info about selected object            |\n"
+    "|        <-->  use arrows to reduce/increase opacity       |\n"
+    "|        w/s   toggle wireframe/surface style              |\n"
+    "|        p/P   change point size of vertices               |\n"
+    "|        l     toggle edges visibility                     |\n"
+    "|        x     toggle mesh visibility                      |\n"
+    "|        X     invoke a cutter widget tool                 |\n"
+    "|        1-2   change mesh color                           |\n"
+    "|        4     use data array as colors, if present        |\n"
+    "|        5-6   change background color(s)                  |\n"
+    "|        09+-  (on keypad) or +/- to cycle axes style      |\n"
+    "|        k     cycle available lighting styles             |\n"
+    "|        K     cycle available shading styles              |\n"
+    "|        o/O   add/remove light to scene and rotate it     |\n"
+    "|        n     show surface mesh normals                   |\n"
+    "|        a     toggle interaction to Actor Mode            |\n"
+    "|        j     toggle interaction to Joystick Mode         |\n"
+    "|        r     reset camera position                       |\n"
+    "|        C     print current camera settings               |\n"
+    "|        S     save a screenshot                           |\n"
+    "|        E     export rendering window to numpy file       |\n"
+    "|        q     return control to python script             |\n"
+    "|        Esc   close the rendering window and continue     |\n"
+    "|        F1    abort execution and exit python kernel      |\n"
+    "|----------------------------------------------------------|\n"
+    "| Mouse: Left-click    rotate scene / pick actors          |\n"
+    "|        Middle-click  pan scene                           |\n"
+    "|        Right-click   zoom scene in or out                |\n"
+    "|        Cntrl-click   rotate scene                        |\n"
+    "|----------------------------------------------------------|\n"
+    "| Check out documentation at:  https://vedo.embl.es        |\n"
+    " =========================================================="
+)
+
 def tips():
     from vedo import colors, __version__
-    msg  = " ==========================================================\n"
-    msg += "| Press: i     print info about selected object            |\n"
-    msg += "|        <-->  use arrows to reduce/increase opacity       |\n"
-    msg += "|        w/s   toggle wireframe/surface style              |\n"
-    msg += "|        p/P   change point size of vertices               |\n"
-    msg += "|        l     toggle edges visibility                     |\n"
-    msg += "|        x     toggle mesh visibility                      |\n"
-    msg += "|        X     invoke a cutter widget tool                 |\n"
-    msg += "|        1-2   change mesh color                           |\n"
-    msg += "|        4     use data array as colors, if present        |\n"
-    msg += "|        5-6   change background color(s)                  |\n"
-    msg += "|        09+-  (on keypad) or +/- to cycle axes style      |\n"
-    msg += "|        k     cycle available lighting styles             |\n"
-    msg += "|        K     cycle available shading styles              |\n"
-    msg += "|        o/O   add/remove light to scene and rotate it     |\n"
-    msg += "|        n     show surface mesh normals                   |\n"
-    msg += "|        a     toggle interaction to Actor Mode            |\n"
-    msg += "|        j     toggle interaction to Joystick Mode         |\n"
-    msg += "|        r     reset camera position                       |\n"
-    msg += "|        C     print current camera settings               |\n"
-    msg += "|        S     save a screenshot                           |\n"
-    msg += "|        E     export rendering window to numpy file       |\n"
-    msg += "|        q     return control to python script             |\n"
-    msg += "|        Esc   close the rendering window and continue     |\n"
-    msg += "|        F1    abort execution and exit python kernel      |\n"
-    msg += "|----------------------------------------------------------|\n"
-    msg += "| Mouse: Left-click    rotate scene / pick actors          |\n"
-    msg += "|        Middle-click  pan scene                           |\n"
-    msg += "|        Right-click   zoom scene in or out                |\n"
-    msg += "|        Cntrl-click   rotate scene                        |\n"
-    msg += "|----------------------------------------------------------|\n"
-    msg += "| Check out documentation at:  https://vedo.embl.es        |\n"
-    msg += " =========================================================="
-    colors.printc(msg, dim=1)
+    colors.printc(_tips_msg, dim=1)
 
     msg = " vedo " + __version__ + " "
     colors.printc(msg, invert=1, dim=1, end="")
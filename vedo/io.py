@@ -1,6 +1,6 @@
 from __future__ import division, print_function
 import vtk
-from vtk.util.numpy_support import vtk_to_numpy
+from vtk.util.numpy_support import vtk_to_numpy, numpy_to_vtk
 import os
 import glob
 import numpy as np
@@ -87,6 +87,8 @@ def load(inputobj, unpack=True, force=False):
         flist = inputobj
     elif isinstance(inputobj, str) and inputobj.startswith('https://'):
         flist = [inputobj]
+    elif os.path.isfile(inputobj) or os.path.isdir(inputobj):
+        flist = [inputobj]  # plain path, skip the glob machinery
     else:
         flist = sorted(glob.glob(inputobj))
 
@@ -104,7 +106,8 @@ def load(inputobj, unpack=True, force=False):
             acts.append(a)
 
         elif os.path.isdir(fod):### it's a directory or DICOM
-            flist = os.listdir(fod)
+            # scandir caches the entry type, sparing one stat per file
+            flist = [e.name for e in os.scandir(fod) if e.is_file()]
             if '.dcm' in flist[0]: ### it's DICOM
                 reader = vtk.vtkDICOMImageReader()
                 reader.SetDirectoryName(fod)
@@ -151,6 +154,28 @@ def load(inputobj, unpack=True, force=False):
         return acts
 
 
+# Reader classes for the generic formats handled by _load_file(),
+# keyed by file extension: one dict lookup instead of a long elif chain
+_vtk_readers = {
+    ".vtk":   vtk.vtkDataSetReader,
+    ".ply":   vtk.vtkPLYReader,
+    ".obj":   vtk.vtkOBJReader,
+    ".stl":   vtk.vtkSTLReader,
+    ".byu":   vtk.vtkBYUReader,
+    ".g":     vtk.vtkBYUReader,
+    ".foam":  vtk.vtkOpenFOAMReader,  # OpenFoam
+    ".vtp":   vtk.vtkXMLPolyDataReader,
+    ".vts":   vtk.vtkXMLStructuredGridReader,
+    ".vtu":   vtk.vtkXMLUnstructuredGridReader,
+    ".vtr":   vtk.vtkXMLRectilinearGridReader,
+    ".pvtk":  vtk.vtkPDataSetReader,
+    ".pvtr":  vtk.vtkXMLPRectilinearGridReader,
+    ".pvtu":  vtk.vtkXMLPUnstructuredGridReader,
+    ".txt":   vtk.vtkParticleReader,  # (format is x, y, z, scalar)
+    ".xyz":   vtk.vtkParticleReader,
+    ".facet": vtk.vtkFacetReader,
+}
+
 def _load_file(filename, unpack):
     fl = filename.lower()
 
@@ -243,11 +268,14 @@ def _load_file(filename, unpack):
 
         ################################################################# polygonal mesh:
     else:
-        if fl.endswith(".vtk"): # read all legacy vtk types
+        readercls = _vtk_readers.get(os.path.splitext(fl)[1])
+        if readercls is None:
+            return None
+        reader = readercls()
 
+        if fl.endswith(".vtk"): # read all legacy vtk types
             #output can be:
             # PolyData, StructuredGrid, StructuredPoints, UnstructuredGrid, RectilinearGrid
-            reader = vtk.vtkDataSetReader()
             reader.ReadAllScalarsOn()
             reader.ReadAllVectorsOn()
             reader.ReadAllTensorsOn()
@@ -255,39 +283,6 @@ def _load_file(filename, unpack):
             reader.ReadAllNormalsOn()
             reader.ReadAllColorScalarsOn()
 
-        elif fl.endswith(".ply"):
-            reader = vtk.vtkPLYReader()
-        elif fl.endswith(".obj"):
-            reader = vtk.vtkOBJReader()
-        elif fl.endswith(".stl"):
-            reader = vtk.vtkSTLReader()
-        elif fl.endswith(".byu") or fl.endswith(".g"):
-            reader = vtk.vtkBYUReader()
-        elif fl.endswith(".foam"):  # OpenFoam
-            reader = vtk.vtkOpenFOAMReader()
-        elif fl.endswith(".pvd"):
-            reader = vtk.vtkXMLGenericDataObjectReader()
-        elif fl.endswith(".vtp"):
-            reader = vtk.vtkXMLPolyDataReader()
-        elif fl.endswith(".vts"):
-            reader = vtk.vtkXMLStructuredGridReader()
-        elif fl.endswith(".vtu"):
-            reader = vtk.vtkXMLUnstructuredGridReader()
-        elif fl.endswith(".vtr"):
-            reader = vtk.vtkXMLRectilinearGridReader()
-        elif fl.endswith(".pvtk"):
-            reader = vtk.vtkPDataSetReader()
-        elif fl.endswith(".pvtr"):
-            reader = vtk.vtkXMLPRectilinearGridReader()
-        elif fl.endswith("pvtu"):
-            reader = vtk.vtkXMLPUnstructuredGridReader()
-        elif fl.endswith(".txt") or fl.endswith(".xyz"):
-            reader = vtk.vtkParticleReader()  # (format is x, y, z, scalar)
-        elif fl.endswith(".facet"):
-            reader = vtk.vtkFacetReader()
-        else:
-            return None
-
         reader.SetFileName(filename)
         reader.Update()
         routput = reader.GetOutput()
@@ -973,9 +968,8 @@ def loadNumpy(inobj):
             lut = vtk.vtkLookupTable()
             lut.SetNumberOfTableValues(ncols)
             lut.SetRange(d['LUT_range'])
-            for i in range(ncols):
-                r, g, b, a = lut_list[i]
-                lut.SetTableValue(i, r, g, b, a)
+            rgba = np.round(np.asarray(lut_list)*255).astype(np.uint8)
+            lut.SetTable(numpy_to_vtk(rgba, deep=True)) # fill the table in a single call
             lut.Build()
             msh.mapper().SetLookupTable(lut)
             msh.mapper().ScalarVisibilityOn()  # activate scalars
@@ -1616,13 +1610,15 @@ def screenshot(filename="screenshot.png", scale=None, returnNumpy=False):
     if scale is None:
         scale = settings.screeshotScale
 
+    plt = settings.plotter_instance  # look it up once, this runs per video frame
+
     if settings.screeshotLargeImage:
        w2if = vtk.vtkRenderLargeImage()
-       w2if.SetInput(settings.plotter_instance.renderer)
+       w2if.SetInput(plt.renderer)
        w2if.SetMagnification(scale)
     else:
         w2if = vtk.vtkWindowToImageFilter()
-        w2if.SetInput(settings.plotter_instance.window)
+        w2if.SetInput(plt.window)
         if hasattr(w2if, 'SetScale'):
             w2if.SetScale(scale, scale)
         if settings.screenshotTransparentBackground:
@@ -1,6 +1,7 @@
 from __future__ import division, print_function
 import time
 import sys
+import os
 import vtk
 from vtk.util.numpy_support import vtk_to_numpy
 import numpy as np
@@ -11,6 +12,8 @@ import vedo.utils as utils
 import vedo.settings as settings
 import vedo.addons as addons
 import vedo.backends as backends
+import vedo.shapes as shapes
+import vedo.pyplot
 
 __doc__ = (
     """
@@ -358,8 +361,7 @@ def clear(actor=None, at=None):
 def closeWindow(plotterInstance=None):
     """Close the current or the input rendering window."""
     if not plotterInstance:
-        from vedo.settings import plotter_instance
-        plotterInstance  = plotter_instance
+        plotterInstance = settings.plotter_instance
         if not plotterInstance:
             return
     if plotterInstance.interactor:
@@ -375,6 +377,11 @@ def closePlotter():
     return None
 
 
+def _lerp(a, b, t1, t):
+    # linear interpolation of two (short) tuples, t1 = 1-t
+    return tuple(u * t1 + v * t for u, v in zip(a, b))
+
+
 ########################################################################
 class Plotter:
     """
@@ -458,6 +465,9 @@ class Plotter:
 
     |multiwindows|
     """
+    # no __slots__ here on purpose: user scripts and subclasses
+    # (e.g. Animation) are allowed to attach extra attributes
+    # to a Plotter instance
 
     def __init__(
         self,
@@ -508,6 +518,8 @@ class Plotter:
         self.title = title  # window title
         self.sharecam = sharecam  # share the same camera if multiple renderers
         self._legend = []  # list of legend entries for actors
+        self._legend_index = {}  # legend name -> actors, built lazily by getMeshes
+        self._legend_index_key = None
         self.picked3d = None  # 3d coords of a clicked point on an actor
         self.backgrcol = bg
         self.offscreen = offscreen
@@ -519,9 +531,12 @@ class Plotter:
         # mostly internal stuff:
         self.justremoved = None
         self.axes_instances = []
+        self._axes_cache = {} # last grid-walls assembly built for each renderer
+        self._legend_cache = {} # signature of the legend shown in each renderer
+        self._last_scene = {} # actors committed to each renderer at last show()
         self.icol = 0
         self.clock = 0
-        self._clockt0 = time.time()
+        self._clockt0 = time.perf_counter()
         self.initializedPlotter = False
         self.initializedIren = False
         self.keyPressFunction = None
@@ -596,7 +611,7 @@ class Plotter:
                 printc("Warning: having set N, shape is ignored.", c='r')
             nx = int(np.sqrt(int(N * y / x) + 1))
             ny = int(np.sqrt(int(N * x / y) + 1))
-            lm = [
+            lm = np.array([
                 (nx, ny),
                 (nx, ny + 1),
                 (nx - 1, ny),
@@ -606,14 +621,11 @@ class Plotter:
                 (nx + 1, ny - 1),
                 (nx + 1, ny + 1),
                 (nx - 1, ny - 1),
-            ]
-            ind, minl = 0, 1000
-            for i, m in enumerate(lm):
-                l = m[0] * m[1]
-                if N <= l < minl:
-                    ind = i
-                    minl = l
-            shape = lm[ind]
+            ])
+            # pick the candidate with the least nr. of empty renderers
+            prods = lm[:, 0] * lm[:, 1]
+            ind = np.argmin(np.where(prods >= N, prods, 10**9))
+            shape = tuple(lm[ind])
 
         if isinstance(shape, str):
 
@@ -646,6 +658,8 @@ class Plotter:
                 else:
                     arenderer.SetViewport(i/n, 0,  (i+1)/n, xsplit )
                 self.renderers.append(arenderer)
+                if self.qtWidget is None: # qt provides its own render window
+                    self.window.AddRenderer(arenderer)
 
             for i in rangem:
                 arenderer = vtk.vtkRenderer()
@@ -655,7 +669,10 @@ class Plotter:
                 else:
                     arenderer.SetViewport(i/m, xsplit, (i+1)/m, 1)
                 self.renderers.append(arenderer)
+                if self.qtWidget is None: # qt provides its own render window
+                    self.window.AddRenderer(arenderer)
 
+            bgcol = getColor(self.backgrcol)
             for r in self.renderers:
                 r.SetUseHiddenLineRemoval(settings.hiddenLineRemoval)
                 r.SetLightFollowCamera(settings.lightFollowsCamera)
@@ -666,7 +683,7 @@ class Plotter:
                     r.SetUseDepthPeeling(True)
                     r.SetMaximumNumberOfPeels(settings.maxNumberOfPeels)
                     r.SetOcclusionRatio(settings.occlusionRatio)
-                r.SetBackground(getColor(self.backgrcol))
+                r.SetBackground(bgcol)
                 self.axes_instances.append(None)
 
             self.shape = (n+m,)
@@ -697,6 +714,8 @@ class Plotter:
                     arenderer.SetBackground2(getColor(bg2_))
 
                 self.renderers.append(arenderer)
+                if self.qtWidget is None: # qt provides its own render window
+                    self.window.AddRenderer(arenderer)
                 self.axes_instances.append(None)
 
             self.shape = (len(shape),)
@@ -735,6 +754,12 @@ class Plotter:
                 self.window.AddRenderer(self.backgroundRenderer)
                 self.backgroundRenderer.AddActor(image_actor)
 
+            # resolve colors once, they are invariant inside the grid loop
+            bgcol = getColor(self.backgrcol)
+            bg2col = getColor(bg2) if bg2 else None
+
+            xs = np.linspace(0, 1, shape[0]+1) # viewport edges, computed once
+            ys = np.linspace(0, 1, shape[1]+1)
             for i in reversed(range(shape[0])):
                 for j in range(shape[1]):
                     if settings.useOpenVR:
@@ -752,17 +777,15 @@ class Plotter:
                     if image_actor:
                         arenderer.SetLayer(1)
 
-                    arenderer.SetBackground(getColor(self.backgrcol))
-                    if bg2:
+                    arenderer.SetBackground(bgcol)
+                    if bg2col:
                         arenderer.GradientBackgroundOn()
-                        arenderer.SetBackground2(getColor(bg2))
+                        arenderer.SetBackground2(bg2col)
 
-                    x0 = i / shape[0]
-                    y0 = j / shape[1]
-                    x1 = (i + 1) / shape[0]
-                    y1 = (j + 1) / shape[1]
-                    arenderer.SetViewport(y0, x0, y1, x1)
+                    arenderer.SetViewport(ys[j], xs[i], ys[j+1], xs[i+1])
                     self.renderers.append(arenderer)
+                    if self.qtWidget is None: # qt provides its own render window
+                        self.window.AddRenderer(arenderer)
                     self.axes_instances.append(None)
             self.shape = shape
 
@@ -791,9 +814,6 @@ class Plotter:
 
         self.window.SetWindowName(title)
 
-        for r in self.renderers:
-            self.window.AddRenderer(r)
-
         if self.offscreen:
             if self.axes == 4 or self.axes == 5:
                 self.axes = 0 #doesn't work with those
@@ -868,12 +888,14 @@ class Plotter:
             ren = self.renderer
 
         if utils.isSequence(actors):
+            seen = set(map(id, self.actors)) # avoid O(N^2) membership tests
             for a in actors:
-                if a not in self.actors:
+                if id(a) not in seen:
+                    seen.add(id(a))
                     self.actors.append(a)
                     if render and ren:
                         ren.AddActor(a)
-            if render and self.interactor:
+            if render and self.interactor and settings.immediateRendering:
                 if self.resetcam:
                     self.renderer.ResetCamera()
                 self.interactor.Render()
@@ -882,7 +904,7 @@ class Plotter:
             self.actors.append(actors)
             if render and ren:
                 ren.AddActor(actors)
-                if self.interactor:
+                if self.interactor and settings.immediateRendering:
                     self.interactor.Render()
             return actors
 
@@ -902,14 +924,22 @@ class Plotter:
                 if hasattr(a, 'trail') and a.trail:
                     self.renderer.RemoveActor(a.trail)
                     a.trailPoints = []
-            if a in self.actors:
-                i = self.actors.index(a)
-                del self.actors[i]
-        if render and hasattr(self, 'interactor') and self.interactor:
+            try:
+                self.actors.remove(a)
+            except ValueError:
+                pass
+        if render and hasattr(self, 'interactor') and self.interactor \
+          and settings.immediateRendering:
             self.interactor.Render()
 
     def render(self):
-        """Render the scene."""
+        """Render the scene.
+
+        Note: rendering must stay on the thread owning the OpenGL context,
+        so scene mutators (add/remove/load) never trigger renders from
+        worker threads; to amortize the render cost over many scene
+        updates use ``add(..., render=False)`` and render once at the end.
+        """
         self.interactor.Render()
         return self
 
@@ -1012,16 +1042,11 @@ class Plotter:
                 return []
             else:
                 acs = self.renderers[obj].GetVolumes()
-            vols = []
-            acs.InitTraversal()
-            for i in range(acs.GetNumberOfItems()):
-                a = acs.GetNextItem()
-                if a.GetPickable():
-                    r = self.renderers.index(renderer)
-                    if a == self.axes_instances[r]:
-                        continue
-                    vols.append(a)
-            return vols
+            r = self.renderers.index(renderer)
+            axinst = self.axes_instances[r]
+            # bulk indexed access beats the InitTraversal/GetNextItem protocol
+            vols = [acs.GetItemAsObject(i) for i in range(acs.GetNumberOfItems())]
+            return [a for a in vols if a.GetPickable() and a != axinst]
 
     def getMeshes(self, obj=None, renderer=None):
         """
@@ -1054,33 +1079,34 @@ class Plotter:
             else:
                 acs = self.renderers[obj].GetActors()
 
-            actors = []
-            acs.InitTraversal()
-            for i in range(acs.GetNumberOfItems()):
-                a = acs.GetNextItem()
-                if a.GetPickable():
-                    r = self.renderers.index(renderer)
-                    if a == self.axes_instances[r]:
-                        continue
-                    actors.append(a)
-            return actors
+            r = self.renderers.index(renderer)
+            axinst = self.axes_instances[r]
+            actors = [acs.GetItemAsObject(i) for i in range(acs.GetNumberOfItems())]
+            return [a for a in actors if a.GetPickable() and a != axinst]
 
         elif isinstance(obj, vtk.vtkAssembly):
             cl = vtk.vtkPropCollection()
             obj.GetActors(cl)
-            actors = []
-            cl.InitTraversal()
-            for i in range(obj.GetNumberOfPaths()):
-                act = vtk.vtkActor.SafeDownCast(cl.GetNextProp())
-                if act.GetPickable():
-                    actors.append(act)
-            return actors
+            actors = [vtk.vtkActor.SafeDownCast(cl.GetItemAsObject(i))
+                      for i in range(obj.GetNumberOfPaths())]
+            return [a for a in actors if a.GetPickable()]
 
         elif isinstance(obj, str):  # search the actor by the legend name
+            # (re)build the legend index only when the actors or their legends
+            # have changed, so repeated interactive queries match on the few
+            # keys instead of rescanning the whole actors list
+            key = tuple((id(a), getattr(a, "_legend", None)) for a in self.actors)
+            if key != self._legend_index_key:
+                self._legend_index = {}
+                for a in self.actors:
+                    lg = getattr(a, "_legend", None)
+                    if lg:
+                        self._legend_index.setdefault(lg, []).append(a)
+                self._legend_index_key = key
             actors = []
-            for a in self.actors:
-                if hasattr(a, "_legend") and obj in a._legend:
-                    actors.append(a)
+            for lg, acts in self._legend_index.items():
+                if obj in lg:
+                    actors += acts
             return actors
 
         elif isinstance(obj, vtk.vtkActor):
@@ -1107,22 +1133,19 @@ class Plotter:
             printc("Warning in moveCamera(): fraction is > 1", c='r')
         cam = vtk.vtkCamera()
         cam.DeepCopy(camstart)
-        p1 = np.array(camstart.GetPosition())
-        f1 = np.array(camstart.GetFocalPoint())
-        v1 = np.array(camstart.GetViewUp())
-        c1 = np.array(camstart.GetClippingRange())
-        s1 = camstart.GetDistance()
-
-        p2 = np.array(camstop.GetPosition())
-        f2 = np.array(camstop.GetFocalPoint())
-        v2 = np.array(camstop.GetViewUp())
-        c2 = np.array(camstop.GetClippingRange())
-        s2 = camstop.GetDistance()
-        cam.SetPosition(p2 * fraction + p1 * (1 - fraction))
-        cam.SetFocalPoint(f2 * fraction + f1 * (1 - fraction))
-        cam.SetViewUp(v2 * fraction + v1 * (1 - fraction))
-        cam.SetDistance(s2 * fraction + s1 * (1 - fraction))
-        cam.SetClippingRange(c2 * fraction + c1 * (1 - fraction))
+
+        # interpolate on the plain VTK tuples, avoiding tiny numpy allocations
+        # which would dominate the cost when called in an animation loop
+        frac1 = 1 - fraction
+        cam.SetPosition(_lerp(camstart.GetPosition(), camstop.GetPosition(),
+                              frac1, fraction))
+        cam.SetFocalPoint(_lerp(camstart.GetFocalPoint(), camstop.GetFocalPoint(),
+                                frac1, fraction))
+        cam.SetViewUp(_lerp(camstart.GetViewUp(), camstop.GetViewUp(),
+                            frac1, fraction))
+        cam.SetDistance(camstart.GetDistance() * frac1 + camstop.GetDistance() * fraction)
+        cam.SetClippingRange(_lerp(camstart.GetClippingRange(), camstop.GetClippingRange(),
+                                   frac1, fraction))
         self.camera = cam
         return cam
 
@@ -1512,9 +1535,17 @@ class Plotter:
             if not utils.isSequence(wannabeacts):
                 wannabeacts = [wannabeacts]
 
+            # concrete types that get appended as they are: catching them
+            # here with one lookup skips the isinstance ladder below
+            passthrough = (vedo.Volume, vedo.Picture,
+                           vtk.vtkBillboardTextActor3D)
+
             for a in wannabeacts:  # scan content of list
 
-                if a is None:
+                if type(a) in passthrough:
+                    scannedacts.append(a)
+
+                elif a is None:
                     pass
 
                 elif isinstance(a, vtk.vtkActor):
@@ -1529,8 +1560,7 @@ class Plotter:
 
                 elif isinstance(a, vtk.vtkAssembly):
                     scannedacts.append(a)
-                    import vedo.pyplot as pyplot
-                    if isinstance(a, pyplot.Plot):
+                    if isinstance(a, vedo.pyplot.Plot):
                         a.modified = False
                         self.sharecam = False
                     if a.trail and a.trail not in self.actors:
@@ -1581,12 +1611,10 @@ class Plotter:
                     scannedacts.append(a)
 
                 elif isinstance(a, str):  # assume a filepath or 2D comment was given
-                    import os.path
                     if "." in a and ". " not in a and os.path.isfile(a):
                         out = vedo.io.load(a)
                     else:
-                        from vedo.shapes import Text2D
-                        out = Text2D(a, pos=3)
+                        out = shapes.Text2D(a, pos=3)
                     scannedacts.append(out)
 
                 elif isinstance(a, vtk.vtkMultiBlockDataSet):
@@ -1602,8 +1630,7 @@ class Plotter:
                     scannedacts.append(MeshActor(a))
 
                 elif "trimesh" in str(type(a)):
-                    from vedo.utils import trimesh2vedo
-                    scannedacts.append(trimesh2vedo(a))
+                    scannedacts.append(utils.trimesh2vedo(a))
 
                 else:
                     try:
@@ -1622,8 +1649,10 @@ class Plotter:
         if actors is not None:
             self.actors = []
             actors2show = scan(actors)
+            seen = set()  # avoid O(N^2) list membership tests
             for a in actors2show:
-                if a not in self.actors:
+                if id(a) not in seen:
+                    seen.add(id(a))
                     self.actors.append(a)
         else:
             actors2show = scan(self.actors)
@@ -1687,7 +1716,8 @@ class Plotter:
         # rendering
         for ia in actors2show:  # add the actors that are not already in scene
             if ia:
-                if isinstance(ia, vtk.vtkVolume):
+                # volumes are rare: probe the exact type before walking the MRO
+                if ia.__class__ is vedo.Volume or isinstance(ia, vtk.vtkVolume):
                     self.renderer.AddVolume(ia)
                 else:
                     self.renderer.AddActor(ia)
@@ -1755,17 +1785,20 @@ class Plotter:
                         self.flagWidget.RemoveBalloon(ia)
 
         # remove the ones that are not in actors2show (and their scalarbar if any)
-        for ia in self.getMeshes(at) + self.getVolumes(at):
-            if ia not in actors2show:
-                self.renderer.RemoveActor(ia)
-                if hasattr(ia, 'scalarbar') and ia.scalarbar:
-                    if isinstance(ia.scalarbar, vtk.vtkActor):
-                        self.renderer.RemoveActor(ia.scalarbar)
-                    elif isinstance(ia.scalarbar, vedo.Assembly):
-                        for a in ia.scalarbar.unpack():
-                            self.renderer.RemoveActor(a)
-                if hasattr(ia, 'renderedAt'):
-                    ia.renderedAt.discard(at)
+        if self._last_scene.get(at) != actors2show: # scene composition changed
+            wanted = set(map(id, actors2show)) # avoid rescanning the list per actor
+            for ia in self.getMeshes(at) + self.getVolumes(at):
+                if id(ia) not in wanted:
+                    self.renderer.RemoveActor(ia)
+                    if hasattr(ia, 'scalarbar') and ia.scalarbar:
+                        if isinstance(ia.scalarbar, vtk.vtkActor):
+                            self.renderer.RemoveActor(ia.scalarbar)
+                        elif isinstance(ia.scalarbar, vedo.Assembly):
+                            for a in ia.scalarbar.unpack():
+                                self.renderer.RemoveActor(a)
+                    if hasattr(ia, 'renderedAt'):
+                        ia.renderedAt.discard(at)
+            self._last_scene[at] = list(actors2show)
 
 
         if self.axes is not None:
@@ -1837,7 +1870,10 @@ class Plotter:
             if cm_thickness is not None: self.camera.SetThickness(cm_thickness)
             if cm_viewAngle is not None: self.camera.SetViewAngle(cm_viewAngle)
 
-        if self.resetcam:
+        if self.resetcam and (zoom or azimuth or elevation or roll
+                              or len(viewup) or camera is not None):
+            # ResetCamera() above already set the clipping range,
+            # it only needs refreshing if the camera was moved since
             self.renderer.ResetCameraClippingRange()
 
         self.window.Render() ############################# <----
@@ -1891,15 +1927,15 @@ class Plotter:
 
         if rate:
             if self.clock is None:  # set clock and limit rate
-                self._clockt0 = time.time()
+                self._clockt0 = time.perf_counter()
                 self.clock = 0.0
             else:
-                t = time.time() - self._clockt0
+                t = time.perf_counter() - self._clockt0
                 elapsed = t - self.clock
                 mint = 1.0 / rate
                 if elapsed < mint:
                     time.sleep(mint - elapsed)
-                self.clock = time.time() - self._clockt0
+                self.clock = time.perf_counter() - self._clockt0
 
         if q:  # exit python
             if self.verbose:
@@ -1956,7 +1992,8 @@ class Plotter:
         for a in actors:
             if a in self.actors:
                 self.actors.remove(a)
-        self.interactor.Render()
+        if settings.immediateRendering:
+            self.interactor.Render()
         return widget
 
 
@@ -1968,6 +2005,8 @@ class Plotter:
             self.renderer.RemoveAllViewProps()
             self.actors = []
             settings.collectable_actors = []
+            self._legend_cache = {}
+            self._last_scene = {}
             self.scalarbars = []
             self.sliders = []
             self.buttons = []
@@ -2560,10 +2599,9 @@ class Plotter:
                                   c='g', bold=0)
 
         elif key == "n":  # show normals to an actor
-            from vedo.shapes import NormalLines
             if self.clickedActor in self.getMeshes():
                 if self.clickedActor.GetPickable():
-                    self.renderer.AddActor(NormalLines(self.clickedActor))
+                    self.renderer.AddActor(shapes.NormalLines(self.clickedActor))
                     iren.Render()
             else:
                 print("Click an actor and press n to add normals.")
@@ -45,14 +45,13 @@ def cluster(points, radius):
     """
     if isinstance(points, vtk.vtkActor):
         poly = points.GetMapper().GetInput()
+        pts = vtk_to_numpy(poly.GetPoints().GetData())
     else:
-        src = vtk.vtkPointSource()
-        src.SetNumberOfPoints(len(points))
-        src.Update()
-        vpts = src.GetOutput().GetPoints()
-        for i, p in enumerate(points):
-            vpts.SetPoint(i, p)
-        poly = src.GetOutput()
+        pts = np.ascontiguousarray(points, dtype=float)
+        vpts = vtk.vtkPoints()
+        vpts.SetData(numpy_to_vtk(pts, deep=True)) # all points in one call
+        poly = vtk.vtkPolyData()
+        poly.SetPoints(vpts)
 
     cluster = vtk.vtkEuclideanClusterExtraction()
     cluster.SetInputData(poly)
@@ -64,9 +63,8 @@ def cluster(points, radius):
     idsarr = cluster.GetOutput().GetPointData().GetArray("ClusterId")
     Nc = cluster.GetNumberOfExtractedClusters()
 
-    sets = [[] for i in range(Nc)]
-    for i, p in enumerate(points):
-        sets[idsarr.GetValue(i)].append(p)
+    ids = vtk_to_numpy(idsarr)
+    sets = [pts[ids == i] for i in range(Nc)] # one mask per cluster
 
     acts = []
     for i, aset in enumerate(sets):
@@ -98,13 +96,11 @@ def removeOutliers(points, radius, neighbors=5):
         isactor = True
         poly = points.GetMapper().GetInput()
     else:
-        src = vtk.vtkPointSource()
-        src.SetNumberOfPoints(len(points))
-        src.Update()
-        vpts = src.GetOutput().GetPoints()
-        for i, p in enumerate(points):
-            vpts.SetPoint(i, p)
-        poly = src.GetOutput()
+        vpts = vtk.vtkPoints()
+        vpts.SetData(numpy_to_vtk(np.ascontiguousarray(points, dtype=float),
+                                  deep=True)) # all points in one call
+        poly = vtk.vtkPolyData()
+        poly.SetPoints(vpts)
 
     removal = vtk.vtkRadiusOutlierRemoval()
     removal.SetInputData(poly)
@@ -113,10 +109,7 @@ def removeOutliers(points, radius, neighbors=5):
     removal.GenerateOutliersOff()
     removal.Update()
     rpoly = removal.GetOutput()
-    outpts = []
-    for i in range(rpoly.GetNumberOfPoints()):
-        outpts.append(list(rpoly.GetPoint(i)))
-    outpts = np.array(outpts)
+    outpts = vtk_to_numpy(rpoly.GetPoints().GetData())
     if not isactor:
         return outpts
 
@@ -327,9 +320,7 @@ def densifyCloud(mesh, targetDistance, closestN=6, radius=0, maxIter=None, maxN=
         output = src.GetPolyDataOutput()
         points = vtk.vtkPoints()
         pts = mesh.points()
-        for p in pts:
-            x, y, z = p
-            points.InsertNextPoint(x, y, z)
+        points.SetData(numpy_to_vtk(np.ascontiguousarray(pts, dtype=float), deep=True))
         output.SetPoints(points)
     src.SetExecuteMethod(readPoints)
 
@@ -417,7 +408,9 @@ def delaunay2D(plist, mode='scipy', tol=None):
 
     |delaunay2d| |delaunay2d.py|_
     """
-    plist = np.ascontiguousarray(plist)
+    plist = np.ascontiguousarray(plist, dtype=float)
+    if plist.shape[1] == 2: # make it 3d
+        plist = np.c_[plist, np.zeros(len(plist))]
 
     if mode == 'scipy':
         try:
@@ -430,11 +423,9 @@ def delaunay2D(plist, mode='scipy', tol=None):
 
     pd = vtk.vtkPolyData()
     vpts = vtk.vtkPoints()
-    vpts.SetData(numpy_to_vtk(np.ascontiguousarray(plist), deep=True))
+    vpts.SetData(numpy_to_vtk(plist, deep=True))
     pd.SetPoints(vpts)
 
-    if plist.shape[1] == 2: # make it 3d
-        plist = np.c_[plist, np.zeros(len(plist))]
     delny = vtk.vtkDelaunay2D()
     delny.SetInputData(pd)
     if tol:
@@ -568,7 +559,10 @@ def pcaEllipsoid(points, pvalue=0.95):
 
     P = np.array(coords, ndmin=2, dtype=float)
     cov = np.cov(P, rowvar=0)     # covariance matrix
-    U, s, R = np.linalg.svd(cov)  # singular value decomposition
+    w, V = np.linalg.eigh(cov)    # symmetric solver, eigenvalues ascending
+    w = np.clip(w, 0, None)       # degenerate clouds can yield tiny negatives
+    s = w[::-1]                   # reorder largest first, like svd would
+    R = V[:, ::-1].T
     p, n = s.size, P.shape[0]
     fppf = f.ppf(pvalue, p, n-p)*(n-1)*p*(n+1)/n/(n-p)  # f % point function
     cfac = 1 + 6/(n-1)            # correction factor for low statistics
@@ -813,13 +807,20 @@ class Points(vtk.vtkFollower, BaseActor):
                 if utils.isSequence(cols):
                     c = None
                     if len(cols[0]) == 4:
-                        for i in range(n): # FAST
-                            rc,gc,bc,ac = cols[i]
-                            ucols.InsertNextTuple4(rc, gc, bc, ac)
+                        rgba = np.asarray(cols) # values are already RGBA 0-255
                     else:
-                        for i in range(n): # SLOW
-                            rc,gc,bc = colors.getColor(cols[i])
-                            ucols.InsertNextTuple4(rc*255, gc*255, bc*255, alphas[i]*255)
+                        carr = np.asarray(cols)
+                        if carr.ndim == 2 and np.issubdtype(carr.dtype, np.number):
+                            rgb = carr[:, :3] # numeric rgb, no name lookups needed
+                            if rgb.max() > 1: # 0-255 values, like getColor accepts
+                                rgb = rgb / 255
+                        else:
+                            rgb = np.array([colors.getColor(ci) for ci in cols])
+                        rgba = np.c_[rgb*255, np.asarray(alphas)*255]
+                    # fill the array in one call instead of inserting tuple by tuple
+                    ucols = numpy_to_vtk(np.ascontiguousarray(rgba, dtype=np.uint8),
+                                         deep=True)
+                    ucols.SetName("Points_RGBA")
                 else:
                     c = cols
 
@@ -1586,8 +1587,9 @@ class Points(vtk.vtkFollower, BaseActor):
                 if rotX: T.RotateX(rotX)
                 if rotY: T.RotateY(rotY)
                 if rotZ: T.RotateZ(rotZ)
-                crossvec = np.cross([0,0,1], ni)
-                angle = np.arccos(np.dot([0,0,1], ni))*57.3
+                # cross and dot products against the z versor, written out
+                crossvec = (-ni[1], ni[0], 0)
+                angle = np.arccos(ni[2])*57.3
                 T.RotateWXYZ(angle, crossvec)
                 if cells: # small offset along normal only for cells
                     T.Translate(ni*scale/2)
@@ -1988,6 +1990,10 @@ class Points(vtk.vtkFollower, BaseActor):
         if invert:
             icp.Inverse()
         icp.SetMaximumNumberOfIterations(iters)
+        # stop iterating once the mean distance change becomes negligible
+        icp.CheckMeanDistanceOn()
+        icp.SetMeanDistanceModeToRMS()
+        icp.SetMaximumMeanDistance(1e-05 * target.diagonalSize())
         if rigid:
             icp.GetLandmarkTransform().SetModeToRigidBody()
         icp.SetStartByMatchingCentroids(useCentroids)
@@ -2279,10 +2285,10 @@ class Points(vtk.vtkFollower, BaseActor):
         if not utils.isSequence(alpha):
             alpha = [alpha]*n
 
-        if vmin is None:
-            vmin = arr.GetRange()[0]
-        if vmax is None:
-            vmax = arr.GetRange()[1]
+        if vmin is None or vmax is None:
+            arng = arr.GetRange() # C++ single pass over the scalars
+            if vmin is None: vmin = arng[0]
+            if vmax is None: vmax = arng[1]
 
         ########################### build the look-up table
         lut = vtk.vtkLookupTable()
@@ -2303,10 +2309,9 @@ class Points(vtk.vtkFollower, BaseActor):
             ncols, nalpha = n, len(alpha)
             lut.SetNumberOfTableValues(ncols)
             mycols = colors.colorMap(range(ncols), cmap, 0,ncols)
-            for i,c in enumerate(mycols):
-                r, g, b = c
-                idx = int(i/ncols * nalpha)
-                lut.SetTableValue(i, r, g, b, alpha[idx])
+            aidx = (np.arange(ncols)/ncols*nalpha).astype(int)
+            rgba = np.c_[mycols, np.asarray(alpha)[aidx]] # fill table in one call
+            lut.SetTable(numpy_to_vtk(np.round(rgba*255).astype(np.uint8), deep=True))
             lut.Build()
 
         self._mapper.SetLookupTable(lut)
@@ -2385,10 +2390,10 @@ class Points(vtk.vtkFollower, BaseActor):
         if not utils.isSequence(alpha):
             alpha = [alpha]*n
 
-        if vmin is None:
-            vmin = arr.GetRange()[0]
-        if vmax is None:
-            vmax = arr.GetRange()[1]
+        if vmin is None or vmax is None:
+            arng = arr.GetRange() # C++ single pass over the scalars
+            if vmin is None: vmin = arng[0]
+            if vmax is None: vmax = arng[1]
 
         ########################### build the look-up table
         lut = vtk.vtkLookupTable()
@@ -2409,10 +2414,9 @@ class Points(vtk.vtkFollower, BaseActor):
             ncols, nalpha = n, len(alpha)
             lut.SetNumberOfTableValues(ncols)
             mycols = colors.colorMap(range(ncols), cmap, 0,ncols)
-            for i,c in enumerate(mycols):
-                r, g, b = c
-                idx = int(i/ncols * nalpha)
-                lut.SetTableValue(i, r, g, b, alpha[idx])
+            aidx = (np.arange(ncols)/ncols*nalpha).astype(int)
+            rgba = np.c_[mycols, np.asarray(alpha)[aidx]] # fill table in one call
+            lut.SetTable(numpy_to_vtk(np.round(rgba*255).astype(np.uint8), deep=True))
             lut.Build()
 
         self._mapper.SetLookupTable(lut)
@@ -2530,7 +2534,7 @@ class Points(vtk.vtkFollower, BaseActor):
 
         points = source.polydata()
 
-        locator = vtk.vtkPointLocator()
+        locator = vtk.vtkStaticPointLocator() # threaded build
         locator.SetDataSet(points)
         locator.BuildLocator()
 
@@ -2633,7 +2637,7 @@ class Points(vtk.vtkFollower, BaseActor):
         if N > 1 or radius:
             plocexists = self.point_locator
             if not plocexists or (plocexists and self.point_locator is None):
-                point_locator = vtk.vtkPointLocator()
+                point_locator = vtk.vtkStaticPointLocator() # threaded build
                 point_locator.SetDataSet(poly)
                 point_locator.BuildLocator()
                 self.point_locator = point_locator
@@ -2656,7 +2660,10 @@ class Points(vtk.vtkFollower, BaseActor):
 
         clocexists = self.cell_locator
         if not clocexists or (clocexists and self.cell_locator is None):
-            cell_locator = vtk.vtkCellLocator()
+            if utils.vtkVersionIsAtLeast(9):
+                cell_locator = vtk.vtkStaticCellLocator() # threaded build
+            else:
+                cell_locator = vtk.vtkCellLocator()
             cell_locator.SetDataSet(poly)
             cell_locator.BuildLocator()
             self.cell_locator = cell_locator
@@ -2739,21 +2746,28 @@ class Points(vtk.vtkFollower, BaseActor):
                 Ncp = 5
 
         variances, newpts = [], []
-        #pb = utils.ProgressBar(0, ncoords)
-        for i, p in enumerate(coords):
-            #pb.print("smoothing mesh ...")
-
-            pts = self.closestPoint(p, N=Ncp, radius=radius)
-            if radius and len(pts) < 5:
-                continue
-
-            ptsmean = pts.mean(axis=0)  # plane center
-            _, dd, vv = np.linalg.svd(pts - ptsmean)
-            cv = np.cross(vv[0], vv[1])
-            t = (np.dot(cv, ptsmean) - np.dot(cv, p)) / np.dot(cv,cv)
-            newp = p + cv*t
-            newpts.append(newp)
-            variances.append(dd[2])
+        if radius:
+            for i, p in enumerate(coords):
+                pts = self.closestPoint(p, N=Ncp, radius=radius)
+                if len(pts) < 5:
+                    continue
+                ptsmean = pts.mean(axis=0)  # plane center
+                _, dd, vv = np.linalg.svd(pts - ptsmean)
+                cv = np.cross(vv[0], vv[1])
+                t = (np.dot(cv, ptsmean) - np.dot(cv, p)) / np.dot(cv,cv)
+                newpts.append(p + cv*t)
+                variances.append(dd[2])
+        else:
+            # neighborhoods all have Ncp points: fit every plane in one batch
+            nbhs = np.array([self.closestPoint(p, N=Ncp) for p in coords])
+            means = nbhs.mean(axis=1)
+            X = nbhs - means[:, np.newaxis]
+            covs = np.einsum('nki,nkj->nij', X, X)
+            w, V = np.linalg.eigh(covs) # eigenvalues come out ascending
+            cvs = V[:, :, 0] # smallest eigenvector is the plane normal
+            ts = np.einsum('ni,ni->n', cvs, means - coords) # normals are unit
+            newpts = coords + cvs * ts[:, np.newaxis]
+            variances = np.sqrt(w[:, 0]) # same as the smallest singular value
 
         self.info["variances"] = np.array(variances)
         return self.points(newpts)
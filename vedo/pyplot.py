@@ -745,7 +745,13 @@ def _plotFxy(
         try:
             z = z.replace("math.", "").replace("np.", "")
             namespace = locals()
-            code = "from math import*\ndef zfunc(x,y): return " + z
+            # numpy functions accept whole coordinate arrays at once, while
+            # math fills in the names numpy lacks (erf, gamma, factorial...)
+            code = ("from math import *\n"
+                    "from numpy import *\n"
+                    "asin, acos, atan, atan2 = arcsin, arccos, arctan, arctan2\n"
+                    "asinh, acosh, atanh = arcsinh, arccosh, arctanh\n"
+                    "def zfunc(x,y): return " + z)
             exec(code, namespace)
             z = namespace["zfunc"]
         except:
@@ -764,17 +770,31 @@ def _plotFxy(
     dy = ylim[1] - ylim[0]
     todel, nans = [], []
 
-    for i in range(poly.GetNumberOfPoints()):
-        px, py, _ = poly.GetPoint(i)
-        xv = (px + 0.5) * dx + xlim[0]
-        yv = (py + 0.5) * dy + ylim[0]
-        try:
-            zv = z(xv, yv)
-        except:
-            zv = 0
-            todel.append(i)
-            nans.append([xv, yv, 0])
-        poly.GetPoints().SetPoint(i, [xv, yv, zv])
+    # the plane source points are float32, sample in double like GetPoint did
+    pts = vtk_to_numpy(poly.GetPoints().GetData()).astype(np.float64)
+    xs = (pts[:, 0] + 0.5) * dx + xlim[0]
+    ys = (pts[:, 1] + 0.5) * dy + ylim[0]
+
+    try: # sample the whole grid in one vectorized call
+        with np.errstate(all="ignore"):
+            zs = np.broadcast_to(z(xs, ys), xs.shape).astype(float)
+        bad = ~np.isfinite(zs)
+        if bad.any():
+            todel = list(np.nonzero(bad)[0])
+            nans = np.column_stack([xs[bad], ys[bad], np.zeros(len(todel))]).tolist()
+            zs = np.where(bad, 0, zs)
+    except: # z only takes scalars, fall back to point by point
+        zs = np.zeros_like(xs)
+        for i in range(len(xs)):
+            try:
+                zs[i] = z(xs[i], ys[i])
+            except:
+                todel.append(i)
+                nans.append([xs[i], ys[i], 0])
+
+    # store as float32, the precision SetPoint wrote into the plane source
+    vcoords = np.ascontiguousarray(np.column_stack([xs, ys, zs]), dtype=np.float32)
+    poly.GetPoints().SetData(numpy_to_vtk(vcoords, deep=True))
 
     if len(todel):
         cellIds = vtk.vtkIdList()
@@ -1167,7 +1187,7 @@ def _histogram1D(
         if ytitle=='counts':
             ytitle='log(counts)'
 
-    x0, x1 = np.min(edges), np.max(edges)
+    x0, x1 = edges[0], edges[-1] # edges are sorted
     y0, y1 = 0, np.max(fs)
     binsize = edges[1] - edges[0]
 
@@ -1240,21 +1260,21 @@ def _histogram1D(
         # print('rectangles', r.z())
 
     if outline:  #####################
-        lns = [[myedges[0], 0, 0]]
-        for i in range(bins):
-            lns.append([myedges[i], fs[i], 0])
-            lns.append([myedges[i + 1], fs[i], 0])
-            maxheigth = max(maxheigth, fs[i])
-        lns.append([myedges[-1], 0, 0])
+        # steps of the staircase, assembled in one go
+        lns = np.zeros((2 * bins + 2, 3))
+        lns[1:-1:2, 0] = myedges[:-1]
+        lns[2::2, 0] = myedges[1:]
+        lns[0, 0] = myedges[0]
+        lns[-1, 0] = myedges[-1]
+        lns[1:-1:2, 1] = fs
+        lns[2:-1:2, 1] = fs
+        maxheigth = max(maxheigth, np.max(fs))
         outl = shapes.Line(lns, c=lc, alpha=alpha, lw=lw).z(offs)
         rs.append(outl)
         # print('histo outline', outl.z())
 
-    bin_centers_pos = []
-    for i in range(bins):
-        x = (myedges[i] + myedges[i + 1]) / 2
-        if fs[i]:
-            bin_centers_pos.append([x, fs[i], 0])
+    centers = (myedges[:-1] + myedges[1:]) / 2
+    bin_centers_pos = np.column_stack([centers, fs, np.zeros(bins)])[fs != 0]
 
     if marker:  #####################
 
@@ -2250,9 +2270,8 @@ def cornerHistogram(
         fs = fs[minbin:-1]
     if logscale:
         fs = np.log10(fs + 1)
-    pts = []
-    for i in range(len(fs)):
-        pts.append([(edges[i] + edges[i + 1]) / 2, fs[i]])
+    centers = (edges[:-1] + edges[1:]) / 2
+    pts = np.column_stack([centers[:len(fs)], fs])
 
     plot = cornerPlot(pts, pos, s, title, c, bg, lines, dots)
     plot.SetNumberOfYLabels(2)
@@ -48,6 +48,10 @@ General settings.
     # Allow to interact with scene during interactor.Start() execution
     allowInteraction = True
 
+    # Render the scene right after each add()/remove() call;
+    # set to False to coalesce many scene edits into a single render
+    immediateRendering = True
+
     # Show a gray frame margin in multirendering windows
     showRendererFrame = True
     rendererFrameColor = None
@@ -160,6 +164,10 @@ interactorStyle = None
 # Allow to interact with scene during interactor.Start() execution
 allowInteraction = True
 
+# Render the scene right after each add()/remove() call;
+# set to False to coalesce many scene edits into a single render
+immediateRendering = True
+
 # Show a gray frame margin in multirendering windows
 showRendererFrame = True
 rendererFrameColor = None
@@ -71,6 +71,7 @@ __all__ = [
 
 ##############################################
 _fonts_cache = dict()
+_texts_cache = dict() # polydata of whole strings already polygonized
 _reps = [
     ("\nabla", "∇"),
     ("\infty", "∞"),
@@ -233,6 +234,9 @@ class Glyph(Mesh):
     """
     At each vertex of a mesh, another mesh - a `'glyph'` - is shown with
     various orientation options and coloring.
+    All the glyph copies are baked into a single mesh (hence a single actor),
+    so the scene stays cheap to traverse and render no matter how many
+    vertices the input has.
     The input ``mesh`` can also be a simple list of 2D or 3D coordinates.
     Color can be specified as a colormap which maps the size of the orientation
     vectors in `orientationArray`.
@@ -290,12 +294,9 @@ class Glyph(Mesh):
             cmap = c
             c = None
         elif utils.isSequence(c): # user passing an array of point colors
-            ucols = vtk.vtkUnsignedCharArray()
-            ucols.SetNumberOfComponents(3)
+            ucarr = np.array([getColor(col) for col in c]) * 255
+            ucols = numpy_to_vtk(np.ascontiguousarray(ucarr, dtype=np.uint8), deep=True)
             ucols.SetName("glyph_RGB")
-            for col in c:
-                cl = getColor(col)
-                ucols.InsertNextTuple3(cl[0]*255, cl[1]*255, cl[2]*255)
             poly.GetPointData().SetScalars(ucols)
             c = None
 
@@ -329,11 +330,9 @@ class Glyph(Mesh):
                     gly.SetInputArrayToProcess(0, 0, 0, 0, orientationArray)
                     gly.SetVectorModeToUseVector()
             elif utils.isSequence(orientationArray) and not tol: # passing a list
-                varr = vtk.vtkFloatArray()
-                varr.SetNumberOfComponents(3)
+                varr = numpy_to_vtk(np.ascontiguousarray(orientationArray, dtype=float),
+                                    deep=True)
                 varr.SetName("glyph_vectors")
-                for v in orientationArray:
-                    varr.InsertNextTuple(v)
                 poly.GetPointData().AddArray(varr)
                 poly.GetPointData().SetActiveVectors("glyph_vectors")
                 gly.SetInputArrayToProcess(0, 0, 0, 0, "glyph_vectors")
@@ -347,10 +346,10 @@ class Glyph(Mesh):
         if cmap:
             lut = vtk.vtkLookupTable()
             lut.SetNumberOfTableValues(512)
+            cols = colorMap(np.arange(512), cmap, 0, 512)
+            rgba = np.c_[cols, np.ones(512)]
+            lut.SetTable(numpy_to_vtk(np.round(rgba*255).astype(np.uint8), deep=True))
             lut.Build()
-            for i in range(512):
-                r, g, b = colorMap(i, cmap, 0, 512)
-                lut.SetTableValue(i, r, g, b, 1)
             self.mapper().SetLookupTable(lut)
             self.mapper().ScalarVisibilityOn()
             self.mapper().SetScalarModeToUsePointData()
@@ -738,8 +737,6 @@ class Spline(Line):
 
         Line.__init__(self, np.c_[xnew, ynew, znew], lw=2)
         self.lighting('off')
-        settings.collectable_actors.pop()
-        settings.collectable_actors.append(self)
         self.name = "Spline"
 
 
@@ -795,12 +792,10 @@ class KSpline(Line):
             ln.append((x,y,z))
 
         Line.__init__(self, ln, lw=2, c='gray')
-        settings.collectable_actors.pop()
         self.lighting('off')
         self.name = "KSpline"
         self.base = np.array(points[0])
         self.top = np.array(points[-1])
-        settings.collectable_actors.append(self)
 
 class CSpline(Line):
     """
@@ -842,12 +837,10 @@ class CSpline(Line):
             ln.append((x,y,z))
 
         Line.__init__(self, ln, lw=2, c='gray')
-        settings.collectable_actors.pop()
         self.lighting('off')
         self.name = "CSpline"
         self.base = np.array(points[0])
         self.top = np.array(points[-1])
-        settings.collectable_actors.append(self)
 
 
 def Bezier(points, res=None):
@@ -1661,24 +1654,24 @@ class Spheres(Mesh):
         src.SetPhiResolution(res_phi)
         src.Update()
 
-        psrc = vtk.vtkPointSource()
-        psrc.SetNumberOfPoints(len(centers))
-        psrc.Update()
-        pd = psrc.GetOutput()
-        vpts = pd.GetPoints()
+        pd = vtk.vtkPolyData()
+        vpts = vtk.vtkPoints()
+        pd.SetPoints(vpts)
 
         glyph = vtk.vtkGlyph3D()
         glyph.SetSourceConnection(src.GetOutputPort())
 
         if cisseq:
             glyph.SetColorModeToColorByScalar()
-            ucols = vtk.vtkUnsignedCharArray()
-            ucols.SetNumberOfComponents(3)
+            carr = np.asarray(c)
+            if carr.ndim == 2 and np.issubdtype(carr.dtype, np.number):
+                ucarr = carr[:, :3] # already (N,3) rgb values
+                if ucarr.max() <= 1: # 0-1 floats, like getColor returns
+                    ucarr = ucarr * 255
+            else:
+                ucarr = np.array([getColor(acol) for acol in c]) * 255
+            ucols = numpy_to_vtk(np.ascontiguousarray(ucarr, dtype=np.uint8), deep=True)
             ucols.SetName("colors")
-            #for i, p in enumerate(centers):
-            for acol in c:
-                cx, cy, cz = getColor(acol)
-                ucols.InsertNextTuple3(cx * 255, cy * 255, cz * 255)
             pd.GetPointData().SetScalars(ucols)
             glyph.ScalingOff()
         elif risseq:
@@ -1893,17 +1886,13 @@ class Grid(Mesh):
             pos = (pos[0], pos[1], 0)
 
         if utils.isSequence(sx) and utils.isSequence(sy):
-            verts = []
-            for y in sy:
-                for x in sx:
-                    verts.append([x, y, 0])
-            faces = []
             n = len(sx)
             m = len(sy)
-            for j in range(m-1):
-                j1n = (j+1)*n
-                for i in range(n-1):
-                    faces.append([i+j*n, i+1+j*n, i+1+j1n, i+j1n])
+            X, Y = np.meshgrid(sx, sy)
+            verts = np.column_stack([X.ravel(), Y.ravel(), np.zeros(n*m)])
+            # quad connectivity follows a regular index pattern
+            j0 = (np.arange(m-1)[:,None]*n + np.arange(n-1)).ravel()
+            faces = np.column_stack([j0, j0+1, j0+n+1, j0+n])
 
             Mesh.__init__(self, [verts, faces], c, alpha)
 
@@ -1994,6 +1983,34 @@ def Rectangle(p1=(0, 0), p2=(2, 1), c="g", alpha=1):
     return mesh
 
 
+# texture coordinates of the vtkCubeSource vertices, shared by all Box instances
+_box_tcoords = np.array([
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+        [1.0, 0.0],
+        [0.0, 0.0],
+        [1.0, 1.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [0.0, 0.0],
+        [0.0, 1.0],
+        [0.0, 0.0],
+        [1.0, 1.0],
+        [1.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 0.0],
+        [1.0, 1.0],
+        [0.0, 1.0],
+        [0.0, 0.0],
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [1.0, 1.0],
+])
+
 class Box(Mesh):
     """
     Build a box of dimensions `x=length, y=width and z=height`.
@@ -2012,33 +2029,7 @@ class Box(Mesh):
         src.Update()
         pd = src.GetOutput()
 
-        tc = [
-                [0.0, 0.0],
-                [1.0, 0.0],
-                [0.0, 1.0],
-                [1.0, 1.0],
-                [1.0, 0.0],
-                [0.0, 0.0],
-                [1.0, 1.0],
-                [0.0, 1.0],
-                [1.0, 1.0],
-                [1.0, 0.0],
-                [0.0, 1.0],
-                [0.0, 0.0],
-                [0.0, 1.0],
-                [0.0, 0.0],
-                [1.0, 1.0],
-                [1.0, 0.0],
-                [1.0, 0.0],
-                [0.0, 0.0],
-                [1.0, 1.0],
-                [0.0, 1.0],
-                [0.0, 0.0],
-                [1.0, 0.0],
-                [0.0, 1.0],
-                [1.0, 1.0],
-        ]
-        vtc = numpy_to_vtk(tc)
+        vtc = numpy_to_vtk(_box_tcoords, deep=True)
         pd.GetPointData().SetTCoords(vtc)
 
         Mesh.__init__(self, pd, c, alpha)
@@ -2389,6 +2380,17 @@ class Text(Mesh):
             self.name = "TextNull"
             return
 
+        tkey = (txt, font, s, hspacing, vspacing, depth, italic, justify)
+        cached = _texts_cache.get(tkey)
+        if cached is not None: # same string seen before, copy its polydata
+            tpoly = vtk.vtkPolyData()
+            tpoly.DeepCopy(cached)
+            Mesh.__init__(self, tpoly, c, alpha)
+            self.lighting('off').SetPosition(pos)
+            settings.collectable_actors.append(self)
+            self.name = "Text"
+            return
+
         ###################################################
         notfounds=0
         isvtkfont = False
@@ -2584,7 +2586,7 @@ class Text(Mesh):
                 ymax -= vspacing
 
             elif isvtkfont or t in keys:
-                if t in polydict.keys():
+                if t in polydict:
                     poly = polydict[t] # save time for repeated chars
                     if isvtkfont:
                         pscale = scale
@@ -2678,6 +2680,12 @@ class Text(Mesh):
             extrude.Update()
             tpoly = extrude.GetOutput()
 
+        if len(_texts_cache) > 1000:
+            _texts_cache.clear() # unlikely, but avoid unbounded growth
+        cpoly = vtk.vtkPolyData() # cache a private copy, meshes are mutable
+        cpoly.DeepCopy(tpoly)
+        _texts_cache[tkey] = cpoly
+
         Mesh.__init__(self, tpoly, c, alpha)
         self.lighting('off').SetPosition(pos)
         settings.collectable_actors.append(self)
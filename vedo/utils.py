@@ -633,7 +633,7 @@ def versor(v):
 def mag(z):
     """Get the magnitude of a vector."""
     if isinstance(z[0], np.ndarray):
-        return np.array(list(map(np.linalg.norm, z)))
+        return np.linalg.norm(z, axis=1)
     else:
         return np.linalg.norm(z)
 
@@ -1591,6 +1591,15 @@ def trimesh2vedo(inputobj, alphaPerCell=False):
     return None
 
 
+# the installed VTK version never changes at runtime: probe it once
+try:
+    _vtk_version_number = vtk.VTK_VERSION_NUMBER
+except AttributeError:
+    _vtk_ver = vtk.vtkVersion()
+    _vtk_version_number = 10000000000 * _vtk_ver.GetVTKMajorVersion() \
+                          + 100000000 * _vtk_ver.GetVTKMinorVersion() \
+                          + _vtk_ver.GetVTKBuildVersion()
+
 def vtkVersionIsAtLeast(major, minor=0, build=0):
     """
     Check the VTK version.
@@ -1602,17 +1611,7 @@ def vtkVersionIsAtLeast(major, minor=0, build=0):
     :param build: Build version.
     """
     needed_version = 10000000000*int(major) +100000000*int(minor) +int(build)
-    try:
-        vtk_version_number = vtk.VTK_VERSION_NUMBER
-    except AttributeError:  # as error:
-        ver = vtk.vtkVersion()
-        vtk_version_number = 10000000000 * ver.GetVTKMajorVersion() \
-                             + 100000000 * ver.GetVTKMinorVersion() \
-                             + ver.GetVTKBuildVersion()
-    if vtk_version_number >= needed_version:
-        return True
-    else:
-        return False
+    return _vtk_version_number >= needed_version
 
 def systemReport():
     try:
@@ -1654,9 +1653,8 @@ def ctf2lut(tvobj):
     lut = vtk.vtkLookupTable()
     lut.SetRange(x0,x1)
     lut.SetNumberOfTableValues(len(cols))
-    for i, col in enumerate(cols):
-        r, g, b = col
-        lut.SetTableValue(i, r, g, b, alphas[i])
+    rgba = np.c_[cols, alphas] # fill the table in a single call
+    lut.SetTable(numpy_to_vtk(np.round(rgba*255).astype(np.uint8), deep=True))
     lut.Build()
     return lut
 
@@ -162,7 +162,7 @@ def interpolateToVolume(mesh, kernel='shepard',
     # if radius is None:
     #     radius = min(bounds[1]-bounds[0], bounds[3]-bounds[2], bounds[5]-bounds[4])/3
 
-    locator = vtk.vtkPointLocator()
+    locator = vtk.vtkStaticPointLocator() # threaded build
     locator.SetDataSet(output)
     locator.BuildLocator()
 